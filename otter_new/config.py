@@ -79,6 +79,9 @@ Examples:
     parser.add_argument(
         '--toplist', type=float, default=0, metavar='SECONDS',
         help='Reset scroll to top after N seconds of being hidden (default: 0 = disabled)')
+    parser.add_argument(
+        '--realtime', action='store_true',
+        help='Run with SCHED_FIFO scheduling for lower trigger latency (needs CAP_SYS_NICE)')
 
     # Edge trigger (mutually exclusive)
     edge_group = parser.add_mutually_exclusive_group()
@@ -253,6 +256,7 @@ def args_to_config(args: argparse.Namespace) -> Dict:
         'south': args.south,
         'east': args.east,
         'west': args.west,
+        'edge': next((e for e in ('south', 'east', 'west') if getattr(args, e)), 'north'),
         'recent': args.recent,
         'main_character': args.main_character,
         'ignore_list': ignore_list,
@@ -1,5 +1,11 @@
 """Constants and default values"""
 
+import os
+
+# Application icon, resolved once at import
+ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'images', 'app_icon.png')
+ICON_EXISTS = os.path.exists(ICON_PATH)
+
 # Workspace color palette (supports up to 10 workspaces)
 WORKSPACE_COLORS = [
     "#E74C3C",  # 1: Red
@@ -45,6 +51,7 @@ DEFAULT_CONFIG = {
     'south': False,
     'east': False,
     'west': False,
+    'edge': 'north',
     'recent': False,
     'main_character': False,
     'ignore_list': [],
@@ -52,11 +59,27 @@ DEFAULT_CONFIG = {
 
 # Performance tuning
 EDGE_TRIGGER_THRESHOLD = 5  # pixels
-MOUSE_POLL_INTERVAL = 100   # milliseconds
-CACHE_UPDATE_INTERVAL = 5000  # milliseconds
+HOTBOX_BUFFER = 10  # pixels around the switcher window that don't hide it
+# Edge polling at 10 ms keeps trigger latency below perception, at the cost of
+# greater power usage; the poll exits early away from the edge and is stopped
+# while disabled or paused, so idle wakeups stay cheap.
+MOUSE_POLL_INTERVAL = 10   # milliseconds
+NICE_INCREMENT = -5  # applied at startup when permitted (needs CAP_SYS_NICE)
+REALTIME_PRIORITY = 10  # SCHED_FIFO priority used by --realtime
+SCROLL_FLUSH_INTERVAL = 16  # milliseconds (one frame at 60 Hz)
+SHOW_GRACE_PERIOD_US = 300000  # microseconds after showing before auto-hide is allowed
+WORKSPACE_SWITCH_STEP_INTERVAL = 50  # milliseconds between middle-click switch steps
+CLICK_TIMESTAMP_REUSE = 2.0  # seconds a click's event time is reused by follow-ups
+CACHE_UPDATE_INTERVAL = 5  # seconds (timeout_add_seconds lets GLib coalesce wakeups)
+CACHE_REFRESH_MIN_AGE_US = 4500000  # microseconds - skip a refresh if the last one finished this recently
+POPULATE_DEBOUNCE_INTERVAL = 30  # milliseconds to coalesce window open/close events
 MAX_CACHE_SIZE = 100  # screenshots
+SCREENSHOT_MAX_AGE = 30  # seconds - recapture unchanged windows at least this often
+SURFACE_POOL_SIZE = 8  # scratch cairo surfaces kept for thumbnail capture
 
 # Wnck management
 WNCK_RECREATION_INTERVAL = 3600  # 1 hour
 WNCK_MAX_CALLS = 10000
 WNCK_GRACE_PERIOD = 2.0  # seconds after recreation
+WINDOW_LIST_CACHE_TTL = 0.075  # seconds a get_user_windows() result is reused
+WNCK_FORCE_UPDATE_INTERVAL = 0.2  # seconds - skip force_update() if one ran this recently
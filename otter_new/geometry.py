@@ -6,6 +6,43 @@ from gi.repository import Gdk
 
 logger = logging.getLogger(__name__)
 
+# Default display and its core pointer, looked up once. Otter only runs on
+# the display it was started on, and these are queried on every mouse poll.
+_display: Optional[Gdk.Display] = None
+_pointer: Optional[Gdk.Device] = None
+
+
+def _get_display() -> Optional[Gdk.Display]:
+    """Get the default display, cached after the first lookup
+    
+    Returns:
+        Display or None
+    """
+    global _display
+    if _display is None:
+        _display = Gdk.Display.get_default()
+    return _display
+
+
+def _get_pointer() -> Optional[Gdk.Device]:
+    """Get the default seat's pointer device, cached after the first lookup
+    
+    Returns:
+        Pointer device or None
+    """
+    global _pointer
+    if _pointer is None:
+        display = _get_display()
+        if not display:
+            return None
+        
+        seat = display.get_default_seat()
+        if not seat:
+            return None
+        
+        _pointer = seat.get_pointer()
+    return _pointer
+
 
 def get_monitor_at_point(x: int, y: int) -> Optional[Gdk.Monitor]:
     """Get the monitor containing the given point
@@ -18,7 +55,7 @@ def get_monitor_at_point(x: int, y: int) -> Optional[Gdk.Monitor]:
         Monitor object or None
     """
     try:
-        display = Gdk.Display.get_default()
+        display = _get_display()
         if not display:
             return None
         return display.get_monitor_at_point(x, y)
@@ -57,7 +94,7 @@ def get_all_monitors() -> List[Dict[str, int]]:
     """
     monitors = []
     try:
-        display = Gdk.Display.get_default()
+        display = _get_display()
         if not display:
             return [{'x': 0, 'y': 0, 'width': 1920, 'height': 1080}]
         
@@ -79,22 +116,17 @@ def get_pointer_position() -> Tuple[int, int]:
     Returns:
         Tuple of (x, y) coordinates
     """
+    global _pointer
     try:
-        display = Gdk.Display.get_default()
-        if not display:
-            return (0, 0)
-        
-        seat = display.get_default_seat()
-        if not seat:
-            return (0, 0)
-        
-        pointer = seat.get_pointer()
+        pointer = _get_pointer()
         if not pointer:
             return (0, 0)
         
         screen, x, y = pointer.get_position()
         return (int(x), int(y))
     except Exception as e:
+        # Look the device up again next time in case the seat changed
+        _pointer = None
         logger.debug(f"Error getting pointer position: {e}")
         return (0, 0)
 
@@ -229,35 +261,32 @@ def adjust_position_for_cursor(
     return (pos_x, pos_y)
 
 
-def check_edge_trigger(x: int, y: int, edge: str, monitor: Dict[str, int], threshold: int = 5) -> bool:
-    """Check if pointer is at the specified edge
+def get_edge_band(edge: str, monitor: Dict[str, int], threshold: int = 5) -> Tuple[int, int]:
+    """Get the range of pointer coordinates that count as at the edge
+    
+    The range is on the edge's axis (y for north/south, x for east/west);
+    callers check separately that the pointer is within the monitor.
     
     Args:
-        x: Pointer X coordinate
-        y: Pointer Y coordinate
         edge: Edge to check ('north', 'south', 'east', 'west')
         monitor: Monitor geometry dictionary
         threshold: Distance from edge in pixels
         
     Returns:
-        True if pointer is at edge
+        Inclusive (low, high) bounds; empty for an unknown edge
     """
     mon_x = monitor['x']
     mon_y = monitor['y']
-    mon_width = monitor['width']
-    mon_height = monitor['height']
-    
-    # Check if pointer is within monitor bounds
-    if not (mon_x <= x < mon_x + mon_width and mon_y <= y < mon_y + mon_height):
-        return False
     
     if edge == 'north':
-        return y <= mon_y + threshold
+        return (mon_y, mon_y + threshold)
     elif edge == 'south':
-        return y >= mon_y + mon_height - threshold
+        bottom = mon_y + monitor['height']
+        return (bottom - threshold, bottom - 1)
     elif edge == 'east':
-        return x >= mon_x + mon_width - threshold
+        right = mon_x + monitor['width']
+        return (right - threshold, right - 1)
     elif edge == 'west':
-        return x <= mon_x + threshold
+        return (mon_x, mon_x + threshold)
     
-    return False
+    return (1, 0)
@@ -1,17 +1,43 @@
 """Input handling: edge detection, events, shift monitoring"""
 
 import logging
+import time
 from typing import Callable, Optional
 from gi.repository import Gtk, Gdk, GLib
 
-from .geometry import get_pointer_position, get_monitor_at_point, get_monitor_geometry, check_edge_trigger
-from .constants import EDGE_TRIGGER_THRESHOLD, MOUSE_POLL_INTERVAL
+from .geometry import get_pointer_position, get_monitor_at_point, get_monitor_geometry, get_edge_band
+from .constants import CLICK_TIMESTAMP_REUSE, EDGE_TRIGGER_THRESHOLD, HOTBOX_BUFFER, MOUSE_POLL_INTERVAL, SCROLL_FLUSH_INTERVAL, WORKSPACE_SWITCH_STEP_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# Pre-bound GI functions used on hot paths (skip repository attribute lookups)
+_timeout_add = GLib.timeout_add
+_source_remove = GLib.source_remove
+_idle_add = GLib.idle_add
+_keyval_name = Gdk.keyval_name
+_get_event_time = Gtk.get_current_event_time
+_get_monotonic_time = GLib.get_monotonic_time
+
+# Shift keys that trigger temporary hide (including ISO variants for international keyboards)
+_SHIFT_KEYS = frozenset({'Shift_L', 'Shift_R', 'ISO_Left_Shift', 'ISO_Right_Shift'})
+
+
+def _x11_timestamp() -> int:
+    """Current time as an X11 timestamp (for callbacks without an event time)
+    
+    The X server stamps events with CLOCK_MONOTONIC milliseconds, so the
+    monotonic clock lines up with server time where the wall clock doesn't.
+    """
+    return int(time.monotonic() * 1000) & 0xFFFFFFFF
+
 
 class EdgeDetector:
-    """Detects mouse at screen edges"""
+    """Detects mouse at screen edges
+
+    The poll only runs between start() and stop(). OtterApp stops it for
+    the DISABLED state (and the tray stops it while paused), so
+    _check_position only acts on HIDDEN and VISIBLE.
+    """
 
     def __init__(self, edge: str, on_trigger: Callable, on_leave: Callable, main_character: bool = False, blacklist_apps: list = None):
         """Initialize edge detector
@@ -29,21 +55,92 @@ class EdgeDetector:
         self.main_character = main_character
         self.blacklist_apps = blacklist_apps or []
         self.window_manager = None  # Set externally
-        self.switcher_window = None  # Set externally to check if mouse is over window
+        self.switcher_window = None  # Set via setup() to check if mouse is over window
+        self._window = None  # switcher_window's GTK window, resolved once in setup()
         self.app = None  # Set externally to check state machine
 
+        # State members bound once (imported here: main imports this module)
+        from .main import OtterState
+        self._hidden = OtterState.HIDDEN
+        self._visible = OtterState.VISIBLE
+
         self.monitor_id = None
+
+        # Monitor cache: the edge axis and the last monitor seen under the pointer
+        self._edge_on_y = edge in ('north', 'south')
+        self._cached_monitor_rect = None  # (left, top, right, bottom)
+        self._cached_edge_band = None  # (lo, hi) on the edge axis, inclusive
+        self._last_idle_xy = None  # Pointer position of the last idle HIDDEN tick
+
+        # Hotbox bounds, kept current by on_window_configure
+        self._hotbox = None  # (left, top, right, bottom)
+
+        # Monitor layout changes invalidate the cached bounds
+        try:
+            screen = Gdk.Screen.get_default()
+            if screen:
+                screen.connect("monitors-changed", self._invalidate_monitor_cache)
+        except Exception as e:
+            logger.debug(f"Could not watch monitor changes: {e}")
     
+    def _cache_monitor(self, monitor_geom: dict):
+        """Remember monitor bounds and the edge trigger band for later ticks
+
+        The band is the inclusive range of the edge-axis coordinate that
+        counts as "at edge", so pointers on this monitor are tested with one
+        range compare instead of a monitor query each tick.
+
+        Args:
+            monitor_geom: Monitor geometry dictionary
+        """
+        mon_x = monitor_geom['x']
+        mon_y = monitor_geom['y']
+        self._cached_monitor_rect = (mon_x, mon_y,
+                                     mon_x + monitor_geom['width'],
+                                     mon_y + monitor_geom['height'])
+        self._cached_edge_band = get_edge_band(self.edge, monitor_geom, EDGE_TRIGGER_THRESHOLD)
+
+    def _invalidate_monitor_cache(self, *args):
+        """Drop cached monitor bounds (monitor layout changed)"""
+        self._cached_monitor_rect = None
+        self._cached_edge_band = None
+        self._last_idle_xy = None
+
+    def _cached_edge_test(self, x: int, y: int):
+        """Check the edge against the cached monitor, if the pointer is on it
+
+        Args:
+            x: Pointer X coordinate
+            y: Pointer Y coordinate
+
+        Returns:
+            True/False if the pointer is on the cached monitor, None otherwise
+        """
+        rect = self._cached_monitor_rect
+        if rect is None:
+            return None
+
+        left, top, right, bottom = rect
+        if not (left <= x < right and top <= y < bottom):
+            return None
+
+        lo, hi = self._cached_edge_band
+        coord = y if self._edge_on_y else x
+        return lo <= coord <= hi
+
     def start(self):
         """Start monitoring mouse position"""
         if self.monitor_id is None:
-            self.monitor_id = GLib.timeout_add(MOUSE_POLL_INTERVAL, self._check_position)
+            self._invalidate_monitor_cache()
+            # Low priority so GTK redraws pre-empt the poll
+            self.monitor_id = _timeout_add(MOUSE_POLL_INTERVAL, self._check_position,
+                                           priority=GLib.PRIORITY_LOW)
             logger.info(f"Edge detector started (edge: {self.edge})")
     
     def stop(self):
         """Stop monitoring"""
         if self.monitor_id is not None:
-            GLib.source_remove(self.monitor_id)
+            _source_remove(self.monitor_id)
             self.monitor_id = None
             logger.info("Edge detector stopped")
     
@@ -71,134 +168,156 @@ class EdgeDetector:
             logger.debug(f"Error checking blacklist: {e}")
             return False
 
-    def _mouse_in_window(self, x: int, y: int) -> bool:
-        """Check if mouse is within window bounds
+    def setup(self, switcher_window):
+        """Attach the switcher window used for the hide hotbox
         
         Args:
-            x: Mouse X coordinate
-            y: Mouse Y coordinate
+            switcher_window: SwitcherWindow instance
+        """
+        self.switcher_window = switcher_window
+        self._window = switcher_window.window
+        self._window.connect("configure-event", self.on_window_configure)
+    
+    def on_window_configure(self, widget, event) -> bool:
+        """Track switcher window geometry (configure-event handler)
+        
+        Args:
+            widget: GTK window
+            event: Configure event
             
         Returns:
-            True if mouse is in window
+            False to propagate event
         """
-        if not self.switcher_window or not self.switcher_window.window:
-            return False
+        self._set_hotbox(event.x, event.y, event.width, event.height)
+        return False
+    
+    def _set_hotbox(self, win_x: int, win_y: int, width: int, height: int) -> tuple:
+        """Precompute hotbox bounds (window bounds + buffer)
         
-        try:
-            window = self.switcher_window.window
-            if not window.get_visible():
-                return False
+        Args:
+            win_x: Window X position
+            win_y: Window Y position
+            width: Window width
+            height: Window height
+            
+        Returns:
+            Tuple of (left, top, right, bottom)
+        """
+        self._hotbox = (
+            win_x - HOTBOX_BUFFER,
+            win_y - HOTBOX_BUFFER,
+            win_x + width + HOTBOX_BUFFER,
+            win_y + height + HOTBOX_BUFFER,
+        )
+        return self._hotbox
+    
+    def _query_hotbox(self, window) -> tuple:
+        """Query switcher window geometry and cache its hotbox
+        
+        Args:
+            window: GTK window
             
-            # Get window position and size
+        Returns:
+            Tuple of (left, top, right, bottom), or None on error
+        """
+        try:
             win_x, win_y = window.get_position()
             allocation = window.get_allocation()
-            win_width = allocation.width
-            win_height = allocation.height
-            
-            # Check if mouse is within window bounds
-            return (win_x <= x <= win_x + win_width and 
-                    win_y <= y <= win_y + win_height)
         except Exception as e:
-            logger.debug(f"Error checking mouse in window: {e}")
-            return False
+            logger.debug(f"Error getting window geometry: {e}")
+            return None
+        return self._set_hotbox(win_x, win_y, allocation.width, allocation.height)
     
     def _check_position(self) -> bool:
         """Check mouse position (GLib callback)
         
+        The geometry helpers and Wnck checks handle their own errors, so
+        only the state-machine callbacks are wrapped in try/except.
+        
         Returns:
             True to continue monitoring
         """
-        try:
-            # Get pointer position
-            x, y = get_pointer_position()
-            
+        # Get pointer position
+        x, y = get_pointer_position()
+        
+        # Get current state from app
+        current_state = self.app.otter_state if self.app else self._hidden
+        
+        # Pointer hasn't moved since a HIDDEN tick that found it off the edge
+        xy = (x, y)
+        if xy == self._last_idle_xy and current_state is self._hidden:
+            return True
+        self._last_idle_xy = None
+        
+        # Pointer still on the last monitor - skip the monitor queries
+        at_edge = self._cached_edge_test(x, y)
+        if at_edge is None:
             # Get monitor at pointer
             monitor = get_monitor_at_point(x, y)
-            if not monitor:
+            if monitor is None:
                 return True
             
             monitor_geom = get_monitor_geometry(monitor)
+            self._cache_monitor(monitor_geom)
+            at_edge = self._cached_edge_test(x, y)
+        
+        # Debug logging
+        if at_edge:
+            logger.debug("At edge: state=%s", current_state)
+        
+        # HIDDEN state: check for edge trigger to show window
+        if current_state is self._hidden:
+            # Only pay for the Wnck checks when the mouse is at the edge
+            if not at_edge:
+                # Nothing else affects this outcome - skip until the pointer moves
+                self._last_idle_xy = xy
+                return True
+
+            # Check fullscreen mode if main_character enabled
+            if self.main_character and self.window_manager:
+                if self.window_manager.is_active_window_fullscreen():
+                    return True
+
+            # Check if active window is blacklisted
+            if self._is_active_window_blacklisted():
+                return True
+
+            logger.debug("Calling on_trigger (show)")
+            try:
+                self.on_trigger()
+            except Exception as e:
+                logger.error(f"Error in edge trigger callback: {e}")
+        
+        # VISIBLE state: check for hide conditions
+        elif current_state is self._visible:
+            # Grace period: Don't hide for 300ms after showing (prevents flicker)
+            if _get_monotonic_time() < self.app.grace_deadline:
+                return True
             
-            # Check if at edge (5px threshold)
-            at_edge = check_edge_trigger(x, y, self.edge, monitor_geom, EDGE_TRIGGER_THRESHOLD)
+            # CRITICAL: If mouse is at edge, don't hide (prevents show/hide loop)
+            # The edge area is part of the safe zone when window is visible
+            if at_edge:
+                return True
             
-            # Get current state from app
-            from .main import OtterState
-            current_state = self.app.otter_state if self.app else OtterState.HIDDEN
+            window = self._window
+            if window is None or not window.get_visible():
+                return True
             
-            # Debug logging
-            if at_edge:
-                logger.debug(f"At edge: state={current_state}")
+            # Hotbox = window bounds + 10px buffer (covers the window itself)
+            hotbox = self._hotbox or self._query_hotbox(window)
+            if hotbox is None:
+                return True
             
-            # CRITICAL: During DISABLED state, ignore ALL triggers
-            if current_state == OtterState.DISABLED:
+            left, top, right, bottom = hotbox
+            if left <= x <= right and top <= y <= bottom:
                 return True
             
-            # HIDDEN state: check for edge trigger to show window
-            if current_state == OtterState.HIDDEN:
-                # Check fullscreen mode if main_character enabled
-                if self.main_character and self.window_manager:
-                    if self.window_manager.is_active_window_fullscreen():
-                        return True
-
-                # Check if active window is blacklisted
-                if self._is_active_window_blacklisted():
-                    return True
-
-                # Check if mouse is at edge
-                if at_edge:
-                    logger.debug("Calling on_trigger (show)")
-                    self.on_trigger()
-            
-            # VISIBLE state: check for hide conditions
-            elif current_state == OtterState.VISIBLE:
-                # Grace period: Don't hide for 300ms after showing (prevents flicker)
-                import time
-                if hasattr(self.app, 'last_show_time'):
-                    time_since_show = time.time() - self.app.last_show_time
-                    if time_since_show < 0.3:  # 300ms grace period
-                        return True
-                
-                # CRITICAL: If mouse is at edge, don't hide (prevents show/hide loop)
-                # The edge area is part of the safe zone when window is visible
-                if at_edge:
-                    return True
-                
-                # Check if mouse is in window first
-                mouse_in_window = self._mouse_in_window(x, y)
-                if mouse_in_window:
-                    # Mouse is in window, don't hide
-                    return True
-                
-                # Check if mouse is in hotbox (window bounds + 10px buffer)
-                if self.switcher_window and self.switcher_window.window:
-                    try:
-                        window = self.switcher_window.window
-                        if window.get_visible():
-                            win_x, win_y = window.get_position()
-                            allocation = window.get_allocation()
-                            win_width = allocation.width
-                            win_height = allocation.height
-                            
-                            # Hotbox = window bounds + 10px buffer
-                            buffer = 10
-                            in_hotbox = (
-                                win_x - buffer <= x <= win_x + win_width + buffer and
-                                win_y - buffer <= y <= win_y + win_height + buffer
-                            )
-                            
-                            # If in hotbox, don't hide
-                            if in_hotbox:
-                                return True
-                            
-                            # Mouse left hotbox AND edge - hide
-                            logger.debug("Mouse left hotbox - calling on_leave (hide)")
-                            self.on_leave()
-                    except Exception as e:
-                        logger.debug(f"Error checking hotbox: {e}")
-        
-        except Exception as e:
-            logger.debug(f"Error checking position: {e}")
+            # Mouse left hotbox AND edge - hide
+            logger.debug("Mouse left hotbox - calling on_leave (hide)")
+            try:
+                self.on_leave()
+            except Exception as e:
+                logger.error(f"Error in edge leave callback: {e}")
         
         return True  # Continue monitoring
 
@@ -245,11 +364,14 @@ class ShiftMonitor:
         Returns:
             False to propagate event
         """
+        if not self.enabled:
+            return False
+        
         keyval = event.keyval
-        keyname = Gdk.keyval_name(keyval)
+        keyname = _keyval_name(keyval)
         
         # Debug: Log all key presses when verbose
-        logger.debug(f"Key press detected: {keyname} (keyval: 0x{keyval:x})")
+        logger.debug("Key press detected: %s (keyval: 0x%x)", keyname, keyval)
         
         # Check for custom hide key first
         if self.custom_keyval and keyval == self.custom_keyval:
@@ -258,8 +380,7 @@ class ShiftMonitor:
             return False
         
         # Check if it's a shift key (including ISO variants for international keyboards)
-        shift_keys = ['Shift_L', 'Shift_R', 'ISO_Left_Shift', 'ISO_Right_Shift']
-        if keyname in shift_keys:
+        if keyname in _SHIFT_KEYS:
             logger.info(f"Shift key detected: {keyname}")
             self.on_shift_pressed(keyname)
         
@@ -276,6 +397,44 @@ class EventHandler:
             app: Main application instance
         """
         self.app = app
+        
+        # Scroll coalescing (applied once per frame)
+        self._pending_scroll_delta = 0
+        self._scroll_flush_id = None
+        
+        # Middle-click workspace switch sequence (one timer, stepped)
+        self._workspace_switch_id = None
+        self._workspace_switch_tick = 0
+        
+        # Mouse button -> handler(xid) (2: middle-click, 3: right-click)
+        self._button_dispatch = {
+            2: self.on_middle_click,
+            3: self.app.show_context_menu,
+        }
+        
+        # Event time of the last click, reused by follow-up callbacks
+        self._last_click_ts = 0
+        self._last_click_time = 0.0  # time.monotonic() when recorded
+    
+    def _record_click_timestamp(self) -> int:
+        """Record the current GTK event time for this click
+        
+        Returns:
+            X11 event timestamp
+        """
+        self._last_click_ts = _get_event_time()
+        self._last_click_time = time.monotonic()
+        return self._last_click_ts
+    
+    def _click_timestamp(self) -> int:
+        """Get a timestamp for callbacks that run outside of an event
+        
+        Returns:
+            Last click's event time if recent, otherwise the current time
+        """
+        if self._last_click_ts and time.monotonic() - self._last_click_time < CLICK_TIMESTAMP_REUSE:
+            return self._last_click_ts
+        return _x11_timestamp()
     
     def on_window_clicked(self, button, xid: int):
         """Handle window thumbnail click
@@ -300,15 +459,15 @@ class EventHandler:
             
             # Activate window with error handling
             try:
-                timestamp = Gtk.get_current_event_time()
+                timestamp = self._record_click_timestamp()
                 window.activate(timestamp)
-                logger.debug(f"Activated window {xid}")
+                logger.debug("Activated window %s", xid)
             except Exception as e:
                 logger.error(f"Error activating window {xid}: {e}")
                 return
             
             # Defer hide to let activation complete and avoid BadDrawable
-            GLib.idle_add(self.app.hide_window)
+            _idle_add(self.app.hide_window)
         
         except Exception as e:
             logger.error(f"Error in window click handler: {e}")
@@ -324,21 +483,16 @@ class EventHandler:
         Returns:
             True if handled
         """
-        try:
-            # Right-click: context menu
-            if event.button == 3:
-                self.app.show_context_menu(xid)
-                return True
-            
-            # Middle-click: switch to workspace
-            elif event.button == 2:
-                self.on_middle_click(xid)
-                return True
+        handler = self._button_dispatch.get(event.button)
+        if handler is None:
+            return False
         
+        try:
+            handler(xid)
         except Exception as e:
             logger.error(f"Error handling button press: {e}")
         
-        return False
+        return True
     
     def on_middle_click(self, xid: int):
         """Handle middle-click (switch to workspace without activating)
@@ -364,34 +518,56 @@ class EventHandler:
             # Update MRU timestamp (middle-click counts as interaction)
             self.app.window_manager.update_mru_timestamp(xid)
             
+            timestamp = self._record_click_timestamp()
+            
             # If already on current workspace, activate window
             if workspace == current_workspace:
-                timestamp = Gtk.get_current_event_time()
                 window.activate(timestamp)
                 self.app.hide_window()
             else:
                 # Switch to workspace and activate window
-                timestamp = Gtk.get_current_event_time()
                 workspace.activate(timestamp)
-                logger.debug(f"[STATE] Switched to workspace {workspace.get_name()}, current state: {self.app.otter_state}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[STATE] Switched to workspace %s, current state: %s", workspace.get_name(), self.app.otter_state)
 
                 # Keep otter visible during workspace switch
                 # Don't hide the window - it should stay visible
-                logger.debug(f"[STATE] Keeping otter visible during workspace switch")
-
-                # Store the window XID to bring it to front after otter redisplay
-                self._pending_window_xid_for_stacking = xid
-
-                # Activate window after workspace switch (with delay)
-                GLib.timeout_add(100, lambda: self._activate_window_after_switch(xid))
-
-                # Schedule redisplay on new workspace after 200ms
-                # This ensures otter appears on the new workspace with updated tint
-                GLib.timeout_add(200, self._redisplay_after_workspace_switch)
+                logger.debug("[STATE] Keeping otter visible during workspace switch")
+
+                # Activate window (100ms), redisplay otter on the new workspace
+                # with updated tint (200ms), then restack the window (250ms)
+                if self._workspace_switch_id:
+                    _source_remove(self._workspace_switch_id)
+                self._workspace_switch_tick = 0
+                self._workspace_switch_id = _timeout_add(
+                    WORKSPACE_SWITCH_STEP_INTERVAL, self._workspace_switch_step, xid)
         
         except Exception as e:
             logger.error(f"Error handling middle-click: {e}")
     
+    def _workspace_switch_step(self, xid: int) -> bool:
+        """Advance the post-workspace-switch sequence by one tick
+        
+        Args:
+            xid: Window XID
+            
+        Returns:
+            True until the sequence is complete
+        """
+        self._workspace_switch_tick += 1
+        tick = self._workspace_switch_tick
+        
+        if tick == 2:
+            self._activate_window_after_switch(xid)
+        elif tick == 4:
+            self._redisplay_after_workspace_switch()
+        elif tick >= 5:
+            self._bring_window_to_front_after_otter_display(xid)
+            self._workspace_switch_id = None
+            return False
+        
+        return True
+    
     def _activate_window_after_switch(self, xid: int) -> bool:
         """Activate window after workspace switch
         
@@ -404,28 +580,25 @@ class EventHandler:
         try:
             window = self.app.window_manager.get_window_by_xid(xid)
             if not window:
-                logger.debug(f"Window {xid} no longer exists after workspace switch")
+                logger.debug("Window %s no longer exists after workspace switch", xid)
                 return False
             
             # Validate window is still valid
             if not self.app.window_manager.window_is_valid(window):
-                logger.debug(f"Window {xid} is no longer valid after workspace switch")
+                logger.debug("Window %s is no longer valid after workspace switch", xid)
                 return False
             
-            # Use current time instead of event time (which is 0 in timeout)
-            import time
-            timestamp = int(time.time() * 1000) & 0xFFFFFFFF  # Convert to X11 timestamp
+            # Event time is 0 in a timeout - reuse the middle-click's time
+            timestamp = self._click_timestamp()
             
             try:
                 window.activate(timestamp)
-                logger.debug(f"Activated window {xid} after workspace switch (timestamp: {timestamp})")
+                logger.debug("Activated window %s after workspace switch (timestamp: %s)", xid, timestamp)
             except Exception as e:
                 logger.error(f"Error activating window {xid} after workspace switch: {e}")
         except Exception as e:
             logger.error(f"Error in _activate_window_after_switch: {e}")
         
-        return False
-        
         return False  # Don't repeat
     
     def _redisplay_after_workspace_switch(self) -> bool:
@@ -437,40 +610,34 @@ class EventHandler:
         try:
             from .main import OtterState
 
-            logger.debug(f"[STATE] _redisplay_after_workspace_switch called, current state: {self.app.otter_state}")
+            logger.debug("[STATE] _redisplay_after_workspace_switch called, current state: %s", self.app.otter_state)
 
             # Always ensure window is visible after workspace switch
             if self.app.switcher_window and self.app.switcher_window.window:
                 window = self.app.switcher_window.window
                 was_visible = window.get_visible()
-                logger.debug(f"[STATE] Window visible before redisplay: {was_visible}")
+                logger.debug("[STATE] Window visible before redisplay: %s", was_visible)
 
                 # Reapply workspace tint for new workspace
                 self.app.switcher_window._apply_workspace_tint()
 
                 # Always show window after workspace switch
                 window.show_all()
-                logger.debug(f"[STATE] Called show_all() on window")
+                logger.debug("[STATE] Called show_all() on window")
 
                 # Ensure window is on top
                 window.present()
-                logger.debug(f"[STATE] Called present() on window")
+                logger.debug("[STATE] Called present() on window")
 
                 # Ensure state is VISIBLE
                 if self.app.otter_state != OtterState.VISIBLE:
-                    logger.debug(f"[STATE] Changing state from {self.app.otter_state} to VISIBLE")
-                    self.app.otter_state = OtterState.VISIBLE
-                    self.app.last_show_time = time.time()  # Reset grace period
+                    logger.debug("[STATE] Changing state from %s to VISIBLE", self.app.otter_state)
+                    self.app.transition(OtterState.VISIBLE)  # Resets grace period
 
                 is_visible = window.get_visible()
-                logger.debug(f"[STATE] Window visible after redisplay: {is_visible}")
+                logger.debug("[STATE] Window visible after redisplay: %s", is_visible)
                 logger.info(f"Otter redisplayed after workspace switch (state: {self.app.otter_state}, visible: {is_visible})")
 
-                # Bring the selected app window to front of other apps (below otter which has keep_above)
-                # This ensures the app is reordered to the top of other windows on the workspace
-                if hasattr(self, '_pending_window_xid_for_stacking') and self._pending_window_xid_for_stacking:
-                    GLib.timeout_add(50, lambda: self._bring_window_to_front_after_otter_display(self._pending_window_xid_for_stacking))
-                    self._pending_window_xid_for_stacking = None
         except Exception as e:
             logger.error(f"Error redisplaying otter after workspace switch: {e}")
 
@@ -479,6 +646,9 @@ class EventHandler:
     def on_scroll(self, widget, event) -> bool:
         """Handle mouse wheel scrolling
         
+        Wheel events are accumulated and applied once per frame to avoid
+        re-laying out the scroll window for every event.
+        
         Args:
             widget: GTK widget
             event: Scroll event
@@ -487,15 +657,7 @@ class EventHandler:
             True if handled
         """
         try:
-            if not hasattr(self.app, 'scroll_window'):
-                return False
-            
-            scroll_window = self.app.scroll_window
-            if not scroll_window:
-                return False
-            
-            adjustment = scroll_window.get_vadjustment()
-            if not adjustment:
+            if self.app.scroll_window is None:
                 return False
             
             # Get scroll direction
@@ -506,10 +668,9 @@ class EventHandler:
             else:
                 return False
             
-            # Scroll
-            current = adjustment.get_value()
-            new_value = max(0, min(current + delta, adjustment.get_upper() - adjustment.get_page_size()))
-            adjustment.set_value(new_value)
+            self._pending_scroll_delta += delta
+            if self._scroll_flush_id is None:
+                self._scroll_flush_id = _timeout_add(SCROLL_FLUSH_INTERVAL, self._flush_scroll)
             
             return True
         
@@ -517,6 +678,35 @@ class EventHandler:
             logger.debug(f"Error handling scroll: {e}")
             return False
     
+    def _flush_scroll(self) -> bool:
+        """Apply accumulated scroll delta to the scroll window
+        
+        Returns:
+            False (don't repeat)
+        """
+        delta = self._pending_scroll_delta
+        self._pending_scroll_delta = 0
+        self._scroll_flush_id = None
+        
+        try:
+            scroll_window = self.app.scroll_window
+            if not scroll_window or not delta:
+                return False
+            
+            adjustment = scroll_window.get_vadjustment()
+            if not adjustment:
+                return False
+            
+            # Scroll
+            current = adjustment.get_value()
+            new_value = max(0, min(current + delta, adjustment.get_upper() - adjustment.get_page_size()))
+            adjustment.set_value(new_value)
+        
+        except Exception as e:
+            logger.debug(f"Error applying scroll: {e}")
+        
+        return False
+    
     def on_enter_notify(self, widget, event) -> bool:
         """Handle mouse entering window
         
@@ -528,8 +718,8 @@ class EventHandler:
             False
         """
         # Cancel any pending hide
-        if hasattr(self.app, 'delayed_hide_id') and self.app.delayed_hide_id:
-            GLib.source_remove(self.app.delayed_hide_id)
+        if self.app.delayed_hide_id:
+            _source_remove(self.app.delayed_hide_id)
             self.app.delayed_hide_id = None
         
         return False
@@ -563,21 +753,20 @@ class EventHandler:
         try:
             window = self.app.window_manager.get_window_by_xid(xid)
             if not window:
-                logger.debug(f"Window {xid} no longer exists")
+                logger.debug("Window %s no longer exists", xid)
                 return False
 
             # Validate window is still valid
             if not self.app.window_manager.window_is_valid(window):
-                logger.debug(f"Window {xid} is no longer valid")
+                logger.debug("Window %s is no longer valid", xid)
                 return False
 
-            # Use current time instead of event time
-            import time
-            timestamp = int(time.time() * 1000) & 0xFFFFFFFF
+            # Event time is 0 in a timeout - reuse the middle-click's time
+            timestamp = self._click_timestamp()
 
             try:
                 window.activate(timestamp)
-                logger.debug(f"Brought window {xid} to front of other apps after otter display")
+                logger.debug("Brought window %s to front of other apps after otter display", xid)
             except Exception as e:
                 logger.error(f"Error bringing window {xid} to front: {e}")
         except Exception as e:
@@ -8,34 +8,51 @@ os.environ['NO_AT_BRIDGE'] = '1'
 import logging
 import sys
 import signal
-import time
-from enum import Enum
+from enum import IntEnum
 import gi
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Wnck", "3.0")
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, Gdk, GLib
 
 from .config import parse_arguments, validate_ignore_list, args_to_config
 from .windows import WindowManager
-from .screenshots import ScreenshotManager
-from .input import EdgeDetector, ShiftMonitor, EventHandler
-from .ui import SwitcherWindow, ContextMenu
-from .tray import OtterTrayIcon
+from .constants import (POPULATE_DEBOUNCE_INTERVAL, SHOW_GRACE_PERIOD_US, CACHE_UPDATE_INTERVAL,
+                        CACHE_REFRESH_MIN_AGE_US,
+                        NICE_INCREMENT, REALTIME_PRIORITY)
 
 logger = logging.getLogger(__name__)
 
 
-class OtterState(Enum):
-    """Otter window state machine states"""
-    HIDDEN = "hidden"      # Window hidden, edge detector active
-    VISIBLE = "visible"    # Window shown, edge detector active
-    DISABLED = "disabled"  # Window hidden, edge detector ignores triggers
+class OtterState(IntEnum):
+    """Otter window state machine states (int-valued for cheap comparisons)"""
+    HIDDEN = 0    # Window hidden, edge detector active
+    VISIBLE = 1   # Window shown, edge detector active
+    DISABLED = 2  # Window hidden, edge detector stopped
+
+
+# Members are singletons - hot paths compare by identity against these
+_HIDDEN = OtterState.HIDDEN
+_VISIBLE = OtterState.VISIBLE
+_DISABLED = OtterState.DISABLED
 
 
 class OtterApp:
     """Main Otter application"""
     
+    # Fixed attribute set: slot access is cheaper on the callback hot paths
+    __slots__ = (
+        'config', '_hide_duration', '_hide_duration_ms', '_hide_delay', '_toplist_duration',
+        '_toplist_timeout_ms',
+        'window_manager', 'screenshot_manager', 'event_handler', 'switcher_window', '_gtk_window',
+        'scroll_window', 'context_menu', 'edge_detector', 'shift_monitor', 'tray_icon',
+        'otter_state', 'next_show_time', 'disable_timer_id', 'grace_deadline',
+        'delayed_hide_id', 'toplist_reset_id', 'can_hide',
+        'populate_pending_id', '_window_changed_dispatch', 'last_window_hash',
+        'populate_cache_valid', 'focus_confirmed',
+        'cache_update_id', '_cache_update_steps', 'last_cache_refresh', 'startup_id', '_startup_steps',
+    )
+    
     def __init__(self, config: dict):
         """Initialize application
         
@@ -44,13 +61,55 @@ class OtterApp:
         """
         self.config = config
         
+        # Deliver SIGINT/SIGTERM through the main loop, which wakes poll()
+        # immediately instead of waiting for the next Python bytecode.
+        # Installed before building Wnck, the UI and the tray, so a signal
+        # during startup is held until the loop runs and then cleans up.
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            GLib.unix_signal_add(GLib.PRIORITY_HIGH, signum, self._on_signal, signum)
+        
+        # Config values read on state transitions
+        self._hide_duration = float(config.get('hide_duration', 0))
+        self._hide_duration_ms = int(self._hide_duration * 1000)
+        self._hide_delay = int(config.get('hide_delay', 0))
+        self._toplist_duration = float(config.get('toplist_duration', 0))
+        self._toplist_timeout_ms = int(self._toplist_duration * 1000)
+        
+        # Components (None until constructed, so cleanup() is safe after a partial init)
+        self.screenshot_manager = None
+        self.edge_detector = None
+        self.tray_icon = None
+        self.scroll_window = None
+        
         # State machine
         self.otter_state = OtterState.HIDDEN
-        self.next_show_time = None  # When to transition from DISABLED to VISIBLE
-        self.last_show_time = 0  # Track when window was last shown (for grace period)
+        self.next_show_time = None  # When DISABLED ends (GLib monotonic time, µs)
+        self.disable_timer_id = None  # One-shot timer ending the DISABLED state
+        self.grace_deadline = 0  # GLib monotonic time (µs) until which the window won't auto-hide
         self.delayed_hide_id = None
         self.toplist_reset_id = None  # Timer for toplist scroll reset
         self.can_hide = True  # Semaphore for context menu
+        self.populate_pending_id = None  # Debounced populate after window events
+        # Window events only matter while the grid is on screen
+        self._window_changed_dispatch = {
+            _HIDDEN: self._ignore_window_change,
+            _VISIBLE: self._queue_populate,
+            _DISABLED: self._ignore_window_change,
+        }
+        self.last_window_hash = None  # Fingerprint of the last populated window list
+        self.populate_cache_valid = False  # Grid matches current screenshots
+        self.focus_confirmed = False  # Switcher currently holds keyboard focus
+        self.cache_update_id = None  # Idle source running a cache update
+        self._cache_update_steps = None
+        self.last_cache_refresh = 0  # GLib monotonic time (µs) the last full capture pass finished
+        self.startup_id = None  # Idle source running startup preprocessing
+        self._startup_steps = None
+        
+        # UI modules are only needed by the full app, not by --list
+        from .screenshots import ScreenshotManager
+        from .input import EdgeDetector, ShiftMonitor, EventHandler
+        from .ui import SwitcherWindow, ContextMenu
+        from .tray import OtterTrayIcon
         
         # Initialize GTK
         Gtk.init()
@@ -73,42 +132,38 @@ class OtterApp:
         # Make scroll_window accessible to event handler
         self.scroll_window = self.switcher_window.scroll_window
         
+        # The GTK window lives as long as the app - keep one direct reference
+        self._gtk_window = self.switcher_window.window
+        
         # Initialize context menu
         self.context_menu = ContextMenu(self.window_manager, self.switcher_window, self._on_menu_closed)
         
         # Initialize edge detector
-        edge = 'north'
-        if config.get('south'):
-            edge = 'south'
-        elif config.get('east'):
-            edge = 'east'
-        elif config.get('west'):
-            edge = 'west'
-        
         self.edge_detector = EdgeDetector(
-            edge,
+            config.get('edge', 'north'),
             self._on_edge_trigger,
             self._on_edge_leave,
             config.get('main_character', False),
             config.get('blacklist_apps', [])
         )
         self.edge_detector.window_manager = self.window_manager
-        self.edge_detector.switcher_window = self.switcher_window
+        self.edge_detector.setup(self.switcher_window)
         self.edge_detector.app = self  # Give edge detector access to state machine
         
         # Initialize shift monitor
         self.shift_monitor = ShiftMonitor(
-            config.get('hide_duration', 0),
+            self._hide_duration,
             self._on_shift_pressed,
             config.get('hide_key')  # Custom keyval from --hidekey
         )
-        self.shift_monitor.setup(self.switcher_window.window)
+        self.shift_monitor.setup(self._gtk_window)
         
-        # Start screenshot cache updates
-        GLib.timeout_add(5000, self._update_screenshot_cache)
+        # Track keyboard focus so show_window can skip redundant focus requests
+        self._gtk_window.connect("focus-in-event", self._on_focus_changed, True)
+        self._gtk_window.connect("focus-out-event", self._on_focus_changed, False)
         
-        # Start state machine timer (checks every 100ms for DISABLED → VISIBLE transition)
-        GLib.timeout_add(100, self._check_state_timer)
+        # Start screenshot cache updates
+        GLib.timeout_add_seconds(CACHE_UPDATE_INTERVAL, self._update_screenshot_cache)
         
         # Create system tray icon
         self.tray_icon = OtterTrayIcon(
@@ -119,25 +174,74 @@ class OtterApp:
         
         logger.info("Otter application initialized")
     
+    def transition(self, new_state: OtterState):
+        """Move the state machine to a new state
+        
+        Fields tied to a state change together with it: entering VISIBLE
+        starts the auto-hide grace period, entering DISABLED records when
+        it ends, and entering or leaving DISABLED updates the tray icon.
+        Leaving DISABLED before its one-shot timer fires cancels the timer
+        and resumes edge polling.
+        
+        Args:
+            new_state: State to enter
+        """
+        old_state = self.otter_state
+        now = GLib.get_monotonic_time()
+        
+        if new_state is _DISABLED:
+            self.next_show_time = now + int(self._hide_duration * 1_000_000)
+        else:
+            self.next_show_time = None
+        
+        if new_state is _VISIBLE:
+            self.grace_deadline = now + SHOW_GRACE_PERIOD_US
+        
+        self.otter_state = new_state
+        
+        if (old_state is _DISABLED and new_state is not _DISABLED
+                and self.disable_timer_id is not None):
+            GLib.source_remove(self.disable_timer_id)
+            self.disable_timer_id = None
+            if self.tray_icon is None or not self.tray_icon.paused:
+                self.edge_detector.start()
+        
+        entered_or_left_disabled = (old_state is _DISABLED) != (new_state is _DISABLED)
+        if entered_or_left_disabled and self.tray_icon is not None:
+            self.tray_icon.update_for_state(new_state)
+    
     def _on_window_changed(self, screen, window=None):
         """Handle window open/close events"""
-        # Queue events during DISABLED state (don't process them)
-        if self.otter_state == OtterState.DISABLED:
-            logger.debug("Window changed event queued (DISABLED state)")
-            return
+        self._window_changed_dispatch[self.otter_state]()
+    
+    def _ignore_window_change(self):
+        """Window event while hidden - the next show repopulates anyway"""
+    
+    def _queue_populate(self):
+        """Coalesce bursts of window events into a single populate"""
+        if self.populate_pending_id is None:
+            self.populate_pending_id = GLib.timeout_add(POPULATE_DEBOUNCE_INTERVAL, self._flush_populate)
+    
+    def _flush_populate(self) -> bool:
+        """Populate after a burst of window events (debounce timeout)
         
-        if self.otter_state == OtterState.VISIBLE:
-            GLib.idle_add(self._populate_windows)
+        Returns:
+            False (don't repeat)
+        """
+        self.populate_pending_id = None
+        if self.otter_state is _VISIBLE:
+            self._populate_windows(only_if_changed=True)
+        return False
     
     def _on_edge_trigger(self):
         """Handle edge trigger - transition HIDDEN → VISIBLE"""
-        if self.otter_state == OtterState.HIDDEN:
+        if self.otter_state is _HIDDEN:
             self.show_window()
     
     def _on_edge_leave(self):
         """Handle edge leave - transition VISIBLE → HIDDEN"""
-        logger.debug(f"[STATE] _on_edge_leave called, current state: {self.otter_state}")
-        if self.otter_state == OtterState.VISIBLE:
+        logger.debug("[STATE] _on_edge_leave called, current state: %s", self.otter_state)
+        if self.otter_state is _VISIBLE:
             self.hide_window()
     
     def _on_shift_pressed(self, keyname: str = "Shift"):
@@ -146,52 +250,55 @@ class OtterApp:
         Args:
             keyname: Name of the shift key pressed (Shift_L or Shift_R)
         """
-        if self.otter_state == OtterState.VISIBLE:
-            hide_duration = self.config.get('hide_duration', 0)
-            print(f"🔽 SHIFT PRESSED - Hiding window for {hide_duration}s")
-            logger.debug(f"SHIFT PRESSED - {keyname} - Transitioning to DISABLED for {hide_duration}s")
+        if self.otter_state is _VISIBLE:
+            hide_duration = self._hide_duration
+            logger.info("SHIFT PRESSED - %s - Hiding window for %ss", keyname, hide_duration)
+            
+            # Transition to DISABLED state (also updates the tray icon)
+            self.transition(OtterState.DISABLED)
+            
+            # No edge triggers while DISABLED - stop polling entirely
+            self.edge_detector.stop()
             
-            # Transition to DISABLED state
-            self.otter_state = OtterState.DISABLED
-            self.next_show_time = time.time() + hide_duration
+            # Window is hidden right away, so drop any pending delayed hide
+            if self.delayed_hide_id:
+                GLib.source_remove(self.delayed_hide_id)
+                self.delayed_hide_id = None
             
-            # Update tray icon to show disabled state
-            if hasattr(self, 'tray_icon'):
-                self.tray_icon.update_for_state(self.otter_state)
+            # Schedule the DISABLED → HIDDEN transition
+            self.disable_timer_id = GLib.timeout_add(self._hide_duration_ms, self._on_disable_timeout)
             
             # Hide the window
-            if self.switcher_window and self.switcher_window.window:
-                self.switcher_window.window.hide()
-                # Force GTK to process the hide event
-                while Gtk.events_pending():
-                    Gtk.main_iteration()
+            self._gtk_window.hide()
+            # Send the unmap to the X server now rather than pumping the event queue
+            display = Gdk.Display.get_default()
+            if display:
+                display.flush()
     
-    def _check_state_timer(self) -> bool:
-        """Check state machine timer - handles DISABLED → HIDDEN transition
+    def _on_disable_timeout(self) -> bool:
+        """Called when the shift-hide duration expires - DISABLED → HIDDEN transition
         
         Returns:
-            True to continue timer
+            False (don't repeat)
         """
-        if self.otter_state == OtterState.DISABLED and self.next_show_time is not None:
-            current_time = time.time()
-            if current_time >= self.next_show_time:
-                print("⏰ Shift hide timeout - Re-enabling edge detection")
-                logger.debug("State timer: DISABLED → HIDDEN transition")
-                
-                # Transition to HIDDEN state (not VISIBLE!)
-                # Window stays hidden until mouse reaches edge again
-                self.otter_state = OtterState.HIDDEN
-                self.next_show_time = None
-                
-                # Update tray icon to show normal state
-                if hasattr(self, 'tray_icon'):
-                    self.tray_icon.update_for_state(self.otter_state)
-                
-                # Don't show the window - let edge detector handle it
-                # This allows user to work near the edge without interference
-                logger.debug("Edge detection re-enabled, window remains hidden until edge trigger")
-        
-        return True  # Continue timer
+        self.disable_timer_id = None
+        
+        if self.otter_state is _DISABLED:
+            logger.info("Shift hide timeout - Re-enabling edge detection (DISABLED → HIDDEN)")
+            
+            # Transition to HIDDEN state (not VISIBLE!)
+            # Window stays hidden until mouse reaches edge again
+            self.transition(OtterState.HIDDEN)
+            
+            # Don't show the window - let edge detector handle it
+            # This allows user to work near the edge without interference
+            logger.debug("Edge detection re-enabled, window remains hidden until edge trigger")
+        
+        # Resume edge polling (unless paused from the tray)
+        if not self.tray_icon.paused:
+            self.edge_detector.start()
+        
+        return False
     
     def _on_menu_closed(self):
         """Handle context menu closed"""
@@ -204,27 +311,43 @@ class OtterApp:
             False (don't repeat)
         """
         try:
-            if self.switcher_window and self.switcher_window.window:
-                window = self.switcher_window.window
-                
-                # Try grab_focus
-                window.grab_focus()
-                
-                # Try setting focus on the GDK window
-                gdk_window = window.get_window()
-                if gdk_window:
-                    gdk_window.focus(Gtk.get_current_event_time())
-                
-                logger.debug("Window focus ensured for shift key detection")
+            window = self._gtk_window
+            
+            # Try grab_focus
+            window.grab_focus()
+            
+            # present() usually suffices - skip the X round-trip if so
+            if window.is_active():
+                self.focus_confirmed = True
+                return False
+            
+            # Try setting focus on the GDK window
+            gdk_window = window.get_window()
+            if gdk_window:
+                gdk_window.focus(Gtk.get_current_event_time())
+            
+            logger.debug("Window focus ensured for shift key detection")
         except Exception as e:
             logger.debug(f"Error ensuring window focus: {e}")
         
         return False  # Don't repeat
     
+    def _on_focus_changed(self, widget, event, has_focus: bool) -> bool:
+        """Record whether the switcher window holds keyboard focus
+        
+        Args:
+            has_focus: True for focus-in, False for focus-out
+        
+        Returns:
+            False to let GTK handle the event as well
+        """
+        self.focus_confirmed = has_focus
+        return False
+    
     def _on_tray_show(self):
         """Handle tray icon left-click - show window"""
         logger.debug("Tray icon clicked - showing window")
-        if self.otter_state != OtterState.DISABLED:
+        if self.otter_state is not _DISABLED:
             self.show_window()
     
     def _on_tray_quit(self):
@@ -236,35 +359,67 @@ class OtterApp:
     def _update_screenshot_cache(self) -> bool:
         """Update screenshot cache periodically
         
+        The captures run as low-priority idle steps (one window each) so
+        the refresh never blocks input handling. Wnck and GDK must stay on
+        the main thread, so this is chunked rather than threaded.
+        
         Returns:
             True to continue
         """
         try:
-            if self.otter_state != OtterState.VISIBLE:
+            # A pass that finished moments ago (a long one, or startup) is still fresh
+            if GLib.get_monotonic_time() - self.last_cache_refresh < CACHE_REFRESH_MIN_AGE_US:
+                return True
+            
+            if (self.otter_state is not _VISIBLE and self.cache_update_id is None
+                    and self.startup_id is None):
                 # Clean up old entries when not visible
                 current_windows = self.window_manager.get_user_windows()
-                self.screenshot_manager.update_cache(current_windows)
+                self._cache_update_steps = self.screenshot_manager.iter_update_cache(current_windows)
+                # Thumbnails are about to change - rebuild on next show
+                self.populate_cache_valid = False
+                self.cache_update_id = GLib.idle_add(self._step_screenshot_cache,
+                                                     priority=GLib.PRIORITY_LOW)
         except Exception as e:
             logger.debug(f"Error updating cache: {e}")
         
         return True
     
+    def _step_screenshot_cache(self) -> bool:
+        """Run one step of the screenshot cache update (idle callback)
+        
+        Returns:
+            True while there are windows left to capture
+        """
+        # Don't capture while the switcher covers other windows
+        if self.otter_state is not _VISIBLE:
+            try:
+                next(self._cache_update_steps)
+                return True
+            except StopIteration:
+                self.last_cache_refresh = GLib.get_monotonic_time()
+            except Exception as e:
+                logger.debug(f"Error updating cache: {e}")
+        
+        self._cache_update_steps = None
+        self.cache_update_id = None
+        return False
+    
     def show_window(self):
         """Show the switcher window - transition to VISIBLE state"""
         try:
             # Don't show if we're in DISABLED state
-            if self.otter_state == OtterState.DISABLED:
+            if self.otter_state is _DISABLED:
                 logger.debug("Skipping show_window - in DISABLED state")
                 return
 
             logger.debug("Showing window - transitioning to VISIBLE")
 
-            # Transition to VISIBLE state
-            self.otter_state = OtterState.VISIBLE
-            self.last_show_time = time.time()  # Track when shown for grace period
+            # Transition to VISIBLE state (starts the auto-hide grace period)
+            self.transition(OtterState.VISIBLE)
 
             # Handle toplist: reset scroll to top if timeout expired
-            toplist_duration = self.config.get('toplist_duration', 0)
+            toplist_duration = self._toplist_duration
             if toplist_duration > 0:
                 if self.toplist_reset_id:
                     # Timer is still running, keep scroll position (don't reset)
@@ -279,37 +434,38 @@ class OtterApp:
                     except Exception as e:
                         logger.debug(f"Error resetting scroll: {e}")
 
-            # Populate with windows
-            self._populate_windows()
+            # Populate with windows (reuses the built grid if nothing changed)
+            self._populate_windows(only_if_changed=self.populate_cache_valid)
 
             # Show window
             self.switcher_window.show()
 
             # Focus window for shift key detection
-            self.switcher_window.window.present()
+            self._gtk_window.present()
 
-            # Try multiple methods to ensure focus
-            GLib.idle_add(self._ensure_window_focus)
+            # Try multiple methods to ensure focus (unless already focused)
+            if not self.focus_confirmed:
+                GLib.idle_add(self._ensure_window_focus)
 
         except Exception as e:
             logger.error(f"Error showing window: {e}")
     
     def hide_window(self):
         """Hide the switcher window"""
-        logger.debug(f"[STATE] hide_window called, can_hide: {self.can_hide}, state: {self.otter_state}")
+        logger.debug("[STATE] hide_window called, can_hide: %s, state: %s", self.can_hide, self.otter_state)
         if not self.can_hide:
-            logger.debug(f"[STATE] hide_window blocked by can_hide flag")
+            logger.debug("[STATE] hide_window blocked by can_hide flag")
             return
         
         try:
-            delay = self.config.get('hide_delay', 0)
+            delay = self._hide_delay
             
             if delay > 0:
                 # Delayed hide
                 if self.delayed_hide_id:
                     GLib.source_remove(self.delayed_hide_id)
                 self.delayed_hide_id = GLib.timeout_add(delay, self._do_hide)
-                logger.debug(f"[STATE] Scheduled delayed hide ({delay}ms)")
+                logger.debug("[STATE] Scheduled delayed hide (%sms)", delay)
             else:
                 # Immediate hide
                 self._do_hide()
@@ -327,7 +483,7 @@ class OtterApp:
             logger.debug("Hiding window - transitioning to HIDDEN")
 
             # Transition to HIDDEN state
-            self.otter_state = OtterState.HIDDEN
+            self.transition(OtterState.HIDDEN)
 
             # Hide with error handling to prevent BadDrawable crashes
             try:
@@ -338,28 +494,48 @@ class OtterApp:
             self.delayed_hide_id = None
 
             # Start toplist timeout if enabled
-            toplist_duration = self.config.get('toplist_duration', 0)
-            if toplist_duration > 0:
+            timeout_ms = self._toplist_timeout_ms
+            if timeout_ms > 0:
                 # Cancel any existing timer
                 if self.toplist_reset_id:
                     GLib.source_remove(self.toplist_reset_id)
 
-                # Set timer to re-enable scroll reset after duration
-                timeout_ms = int(toplist_duration * 1000)
-                self.toplist_reset_id = GLib.timeout_add(timeout_ms, self._on_toplist_timeout)
-                logger.debug(f"Started toplist timer ({toplist_duration}s)")
+                # Set timer to re-enable scroll reset after duration; whole
+                # seconds use the coarse timer so GLib can batch the wakeup
+                if timeout_ms % 1000 == 0:
+                    self.toplist_reset_id = GLib.timeout_add_seconds(timeout_ms // 1000, self._on_toplist_timeout)
+                else:
+                    self.toplist_reset_id = GLib.timeout_add(timeout_ms, self._on_toplist_timeout)
+                logger.debug("Started toplist timer (%ss)", self._toplist_duration)
 
         except Exception as e:
             logger.error(f"Error in _do_hide: {e}")
 
         return False
     
-    def _populate_windows(self):
-        """Populate window with current windows"""
+    def _populate_windows(self, only_if_changed: bool = False):
+        """Populate window with current windows
+        
+        Args:
+            only_if_changed: If True, skip the rebuild when the displayed
+                window list is the same as the last populate
+        """
         try:
-            logger.debug(f"_populate_windows called (state={self.otter_state})")
+            logger.debug("_populate_windows called (state=%s)", self.otter_state)
             windows = self.window_manager.get_user_windows()
+            
+            # Fingerprint of everything a thumbnail button displays
+            window_hash = hash(tuple(
+                (w['xid'], w['name'], w['is_minimized'], w['workspace_index'])
+                for w in windows
+            ))
+            if only_if_changed and window_hash == self.last_window_hash:
+                logger.debug("Window list unchanged - skipping populate")
+                return
+            
+            self.last_window_hash = window_hash
             self.switcher_window.populate(windows)
+            self.populate_cache_valid = True
         except Exception as e:
             logger.error(f"Error populating windows: {e}")
 
@@ -382,76 +558,173 @@ class OtterApp:
         self.can_hide = False
         self.context_menu.show(xid)
     
-    def list_windows(self):
-        """List all windows (for --list option)"""
-        # Force update to get current windows
-        windows = self.window_manager.get_user_windows(force_update=True)
+    def _step_startup(self) -> bool:
+        """Run one step of startup preprocessing (idle callback)
         
-        if not windows:
-            print("\nNo windows found.")
-            return
+        Each step captures one window, so the splash repaints and the main
+        loop stays responsive while thumbnails load.
         
-        print("\nCurrent Windows:")
-        print("-" * 80)
-        print(f"{'Name':<40} {'XID':<12} {'Type':<15} {'Workspace':<10}")
-        print("-" * 80)
+        Returns:
+            True while there are windows left to preprocess
+        """
+        try:
+            if self._startup_steps is None:
+                self._startup_steps = self.screenshot_manager.iter_startup_thumbnails()
+            next(self._startup_steps)
+            return True
+        except StopIteration:
+            self.last_cache_refresh = GLib.get_monotonic_time()
+        except Exception as e:
+            logger.error(f"Error during startup preprocessing: {e}")
         
-        for window_info in windows:
-            name = window_info.get('name', 'Unknown')[:39]
-            xid = window_info.get('xid', 'N/A')
-            window_type = window_info.get('window_type', 'Unknown')
-            workspace = window_info.get('workspace_name', 'Unknown')
-            
-            # Match original format - Type column is variable width
-            print(f"{name:<40} {str(xid):<12} {window_type} {workspace}")
+        self._startup_steps = None
+        self.startup_id = None
         
-        print("-" * 80)
-        print(f"Total: {len(windows)} window(s)")
-        print("\nUsage: otter.py --ignore \"Window Name 1,Window Name 2,...\"")
-        print("(Window names are case-insensitive)\n")
+        # Start edge detection, unless disabled or paused while thumbnails loaded
+        if self.otter_state is not _DISABLED and (self.tray_icon is None or not self.tray_icon.paused):
+            self.edge_detector.start()
+        return False
     
     def run(self):
         """Run the application"""
         try:
-            # Preprocess screenshots
-            logger.info("Starting startup preprocessing...")
-            self.screenshot_manager.preprocess_startup_thumbnails()
-            
-            # Start edge detection
-            self.edge_detector.start()
+            # Startup work runs in low-priority steps inside the main loop, so
+            # the tray icon and signal handlers are live while thumbnails load
+            self.startup_id = GLib.idle_add(self._step_startup, priority=GLib.PRIORITY_LOW)
             
             # Run main loop
             logger.info("Entering main loop")
             Gtk.main()
         
-        except KeyboardInterrupt:
-            logger.info("Interrupted")
-            self.cleanup()
-            sys.exit(0)
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
             raise
     
+    def _on_signal(self, signum: int) -> bool:
+        """Handle SIGINT/SIGTERM from the GLib main loop
+        
+        Args:
+            signum: Signal number
+        
+        Returns:
+            False (remove the signal source)
+        """
+        logger.info("Received signal %d", signum)
+        self.cleanup()
+        Gtk.main_quit()
+        return False
+    
     def cleanup(self):
         """Clean up resources"""
         logger.info("Cleaning up...")
         
         # Stop edge detector
-        if hasattr(self, 'edge_detector'):
+        if self.edge_detector is not None:
             self.edge_detector.stop()
         
+        # Cancel in-progress screenshot cache update
+        if self.cache_update_id:
+            GLib.source_remove(self.cache_update_id)
+            self.cache_update_id = None
+        
+        # Cancel unfinished startup preprocessing (closes the splash)
+        if self.startup_id:
+            GLib.source_remove(self.startup_id)
+            self.startup_id = None
+            if self._startup_steps is not None:
+                self._startup_steps.close()
+                self._startup_steps = None
+        
+        # Cancel pending DISABLED timeout
+        if self.disable_timer_id:
+            GLib.source_remove(self.disable_timer_id)
+            self.disable_timer_id = None
+        
         # Destroy tray icon
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.destroy()
         
         # Clear caches
-        if hasattr(self, 'screenshot_manager'):
+        if self.screenshot_manager is not None:
             self.screenshot_manager.screenshot_cache.clear()
             self.screenshot_manager.last_valid_screenshots.clear()
         
         logger.info("Cleanup complete")
 
 
+def write_window_list(window_manager: WindowManager):
+    """Print the current windows as a table (for --list option)
+    
+    Args:
+        window_manager: WindowManager to query
+    """
+    # Force update to get current windows
+    windows = window_manager.get_user_windows(force_update=True)
+    
+    if not windows:
+        print("\nNo windows found.")
+        return
+    
+    separator = "-" * 80
+    lines = [
+        "\nCurrent Windows:",
+        separator,
+        f"{'Name':<40} {'XID':<12} {'Type':<15} {'Workspace':<10}",
+        separator,
+    ]
+    
+    # Match original format - Type column is variable width
+    lines.extend(
+        f"{w.get('name', 'Unknown')[:39]:<40} {str(w.get('xid', 'N/A')):<12} "
+        f"{w.get('window_type', 'Unknown')} {w.get('workspace_name', 'Unknown')}"
+        for w in windows
+    )
+    
+    lines.append(separator)
+    lines.append(f"Total: {len(windows)} window(s)")
+    lines.append("\nUsage: otter.py --ignore \"Window Name 1,Window Name 2,...\"")
+    lines.append("(Window names are case-insensitive)\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def list_windows_standalone(config: dict):
+    """List windows without building the switcher UI (for --list option)
+    
+    Only Wnck is needed, so this skips the windows, tray icon, timers and
+    screenshot preprocessing that OtterApp sets up.
+    
+    Args:
+        config: Configuration dictionary
+    """
+    Gtk.init()
+    write_window_list(WindowManager(config))
+
+
+def raise_scheduling_priority(realtime: bool = False):
+    """Raise process scheduling priority so edge triggers aren't delayed under load
+    
+    Both calls need CAP_SYS_NICE (or root); without it Otter keeps running
+    at normal priority.
+    
+    Args:
+        realtime: If True, request SCHED_FIFO instead of a nice increment
+    """
+    if realtime:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(REALTIME_PRIORITY))
+            logger.info("Using SCHED_FIFO scheduling (priority %d)", REALTIME_PRIORITY)
+            return
+        except (AttributeError, PermissionError, OSError) as e:
+            logger.warning("Could not enable realtime scheduling: %s", e)
+    
+    try:
+        os.nice(NICE_INCREMENT)
+        logger.debug("Raised scheduling priority (nice %d)", NICE_INCREMENT)
+    except (PermissionError, OSError) as e:
+        logger.debug("Could not raise scheduling priority: %s", e)
+
+
 def main():
     """Main entry point"""
     # Parse arguments
@@ -474,8 +747,7 @@ def main():
     
     # Handle --list
     if args.list:
-        app = OtterApp(config)
-        app.list_windows()
+        list_windows_standalone(config)
         sys.exit(0)
     
     # Log configuration
@@ -485,23 +757,9 @@ def main():
     else:
         logger.info(f"Layout: {config['ncols']} columns, {config['xsize']}px width")
     
-    edge = 'north'
-    if config['south']:
-        edge = 'south'
-    elif config['east']:
-        edge = 'east'
-    elif config['west']:
-        edge = 'west'
-    logger.info(f"Edge: {edge}")
-    
-    # Handle signals
-    def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}")
-        Gtk.main_quit()
-        sys.exit(0)
+    logger.info("Edge: %s", config['edge'])
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    raise_scheduling_priority(args.realtime)
     
     # Create and run app
     try:
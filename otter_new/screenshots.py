@@ -2,10 +2,12 @@
 
 import logging
 import time
-from typing import Optional, Dict
-from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+from collections import OrderedDict
+from typing import Optional, Dict, Iterator
+import cairo
+from gi.repository import Gtk, Gdk, GdkPixbuf
 
-from .constants import MAX_CACHE_SIZE
+from .constants import MAX_CACHE_SIZE, SCREENSHOT_MAX_AGE, SURFACE_POOL_SIZE, ICON_PATH, ICON_EXISTS
 
 logger = logging.getLogger(__name__)
 
@@ -32,92 +34,154 @@ class ScreenshotManager:
         self.thumbnail_width = thumbnail_width
         
         # Caches
-        self.screenshot_cache: Dict[int, GdkPixbuf.Pixbuf] = {}
+        # Least recently captured first, so eviction is popitem(last=False)
+        self.screenshot_cache: 'OrderedDict[int, GdkPixbuf.Pixbuf]' = OrderedDict()
         self.last_valid_screenshots: Dict[int, GdkPixbuf.Pixbuf] = {}
         
+        # Per-window (fingerprint, capture time) for skipping unchanged windows
+        self._fingerprints: Dict[int, tuple] = {}
+        
+        # Scratch capture surfaces by (format, width, height), least recently used first
+        self._surface_pool: 'OrderedDict[tuple, cairo.ImageSurface]' = OrderedDict()
+        
+        # Fingerprint of the XID set seen by the last cache update
+        self._last_window_fingerprint: Optional[int] = None
+        
         # Startup preprocessing
         self.startup_splash = None
         self.startup_preprocessing_active = False
+        
+        # Drop a closed window's thumbnail as soon as Wnck reports it, rather
+        # than on the next sweep (Wnck.Screen is a singleton, so this survives
+        # WindowManager.recreate_wnck_screen)
+        screen = window_manager.screen_wnck
+        if screen:
+            screen.connect("window-closed", self._on_window_closed)
+    
+    def _on_window_closed(self, screen, window):
+        """Forget everything cached for a closed window
+        
+        Args:
+            screen: Wnck screen
+            window: Wnck window that closed
+        """
+        try:
+            xid = window.get_xid()
+        except Exception:
+            return
+        
+        self.screenshot_cache.pop(xid, None)
+        self.last_valid_screenshots.pop(xid, None)
+        self._fingerprints.pop(xid, None)
     
-    def scale_pixbuf(self, pixbuf: GdkPixbuf.Pixbuf) -> Optional[GdkPixbuf.Pixbuf]:
-        """Scale pixbuf to thumbnail size
+    def _viewable_gdk_window(self, window):
+        """Wrap a Wnck window's XID in a foreign GDK window
         
         Args:
-            pixbuf: Source pixbuf
+            window: Wnck window object
             
         Returns:
-            Scaled pixbuf or None
+            Viewable Gdk.Window or None
         """
-        if not pixbuf:
+        if not GDKX11_AVAILABLE:
             return None
         
-        try:
-            width = pixbuf.get_width()
-            height = pixbuf.get_height()
-            
-            if width == 0 or height == 0:
-                return None
-            
-            # Calculate scaled dimensions
-            aspect_ratio = height / width
-            new_width = self.thumbnail_width
-            new_height = int(new_width * aspect_ratio)
-            
-            # Scale with high quality
-            scaled = pixbuf.scale_simple(
-                new_width,
-                new_height,
-                GdkPixbuf.InterpType.BILINEAR
-            )
-            
-            return scaled
-        except Exception as e:
-            logger.debug(f"Error scaling pixbuf: {e}")
+        xid = window.get_xid()
+        if not xid:
             return None
+        
+        display = Gdk.Display.get_default()
+        if not display:
+            return None
+        
+        gdk_window = GdkX11.X11Window.foreign_new_for_display(display, xid)
+        if not gdk_window or not gdk_window.is_viewable():
+            return None
+        
+        return gdk_window
     
-    def capture_window(self, window) -> Optional[GdkPixbuf.Pixbuf]:
-        """Capture window screenshot
+    def _scratch_surface(self, surface_format, width: int, height: int) -> cairo.ImageSurface:
+        """Get a reusable capture surface of the given format and size
+        
+        The capture paints with OPERATOR_SOURCE over the whole surface and
+        the pixels are copied out into a new pixbuf, so reuse is safe.
         
         Args:
-            window: Wnck window object
+            surface_format: cairo format
+            width: Surface width
+            height: Surface height
             
         Returns:
-            Pixbuf or None
+            cairo ImageSurface
         """
-        if not GDKX11_AVAILABLE:
-            return None
+        key = (surface_format, width, height)
+        surface = self._surface_pool.get(key)
+        if surface is None:
+            surface = cairo.ImageSurface(surface_format, width, height)
+            self._surface_pool[key] = surface
+            if len(self._surface_pool) > SURFACE_POOL_SIZE:
+                self._surface_pool.popitem(last=False)
+        else:
+            self._surface_pool.move_to_end(key)
+        return surface
+    
+    def capture_thumbnail(self, window, fast: bool = False) -> Optional[GdkPixbuf.Pixbuf]:
+        """Capture window screenshot directly at thumbnail size
+        
+        Paints the window through a scaled cairo context (FILTER_GOOD, which
+        box-filters large reductions) so only the thumbnail is converted to a
+        pixbuf, rather than building a full-resolution pixbuf and scaling that down.
         
+        Args:
+            window: Wnck window object
+            fast: Use nearest-neighbour filtering (quick preview)
+            
+        Returns:
+            Scaled pixbuf or None
+        """
         try:
-            xid = window.get_xid()
-            if not xid:
+            gdk_window = self._viewable_gdk_window(window)
+            if not gdk_window:
                 return None
             
-            display = Gdk.Display.get_default()
-            if not display:
+            width = gdk_window.get_width()
+            height = gdk_window.get_height()
+            if width <= 0 or height <= 0:
                 return None
             
-            gdk_window = GdkX11.X11Window.foreign_new_for_display(display, xid)
-            if not gdk_window:
-                return None
+            # Thumbnail width, height to preserve the aspect ratio
+            new_width = self.thumbnail_width
+            new_height = max(1, (new_width * height) // width)
             
-            if gdk_window.is_viewable():
-                width = gdk_window.get_width()
-                height = gdk_window.get_height()
-                
-                if width > 0 and height > 0:
-                    pixbuf = Gdk.pixbuf_get_from_window(gdk_window, 0, 0, width, height)
-                    return pixbuf
+            # Opaque windows get an alpha-less surface, which yields a 3-byte
+            # RGB pixbuf instead of RGBA (a quarter less cache memory)
+            visual = gdk_window.get_visual()
+            has_alpha = visual is not None and visual.get_depth() == 32
+            surface_format = cairo.FORMAT_ARGB32 if has_alpha else cairo.FORMAT_RGB24
+            
+            surface = self._scratch_surface(surface_format, new_width, new_height)
+            cr = cairo.Context(surface)
+            cr.scale(new_width / width, new_height / height)
+            Gdk.cairo_set_source_window(cr, gdk_window, 0, 0)
+            cr.get_source().set_filter(cairo.FILTER_FAST if fast else cairo.FILTER_GOOD)
+            cr.set_operator(cairo.OPERATOR_SOURCE)
+            cr.paint()
+            surface.flush()
+            
+            return Gdk.pixbuf_get_from_surface(surface, 0, 0, new_width, new_height)
         
         except Exception as e:
-            logger.debug(f"Error capturing window: {e}")
+            logger.debug(f"Error capturing thumbnail: {e}")
         
         return None
     
-    def get_screenshot(self, window) -> Optional[GdkPixbuf.Pixbuf]:
+    def get_screenshot(self, window, fast: bool = False) -> Optional[GdkPixbuf.Pixbuf]:
         """Get screenshot for window (with caching)
         
         Args:
             window: Wnck window object
+            fast: Capture a nearest-neighbour preview; it is treated as
+                stale so the next cache refresh recaptures it at full quality
             
         Returns:
             Scaled pixbuf or None
@@ -138,14 +202,27 @@ class ScreenshotManager:
             if is_minimized:
                 return self.last_valid_screenshots.get(window_id)
             
+            # Geometry, workspace and focus come from Wnck's client-side
+            # state, so this costs no X round-trip
+            workspace = window.get_workspace()
+            fingerprint = (tuple(window.get_geometry()),
+                           workspace.get_number() if workspace else -1,
+                           window.is_active())
+            
+            # Unchanged window with a recent capture - reuse it
+            previous = self._fingerprints.get(window_id)
+            if (previous is not None and previous[0] == fingerprint
+                    and time.monotonic() - previous[1] < SCREENSHOT_MAX_AGE
+                    and window_id in self.last_valid_screenshots):
+                return self.last_valid_screenshots[window_id]
+            
             # Try to capture
-            if self.window_manager.window_is_valid(window):
-                pixbuf = self.capture_window(window)
-                if pixbuf:
-                    scaled = self.scale_pixbuf(pixbuf)
-                    if scaled:
-                        self.last_valid_screenshots[window_id] = scaled
-                        return scaled
+            scaled = self.capture_thumbnail(window, fast)
+            if scaled:
+                self.last_valid_screenshots[window_id] = scaled
+                # A preview is stamped as infinitely old so it never counts as fresh
+                self._fingerprints[window_id] = (fingerprint, float('-inf') if fast else time.monotonic())
+                return scaled
             
             # Return cached if available
             return self.last_valid_screenshots.get(window_id)
@@ -154,61 +231,83 @@ class ScreenshotManager:
             logger.debug(f"Error getting screenshot: {e}")
             return None
     
-    def update_cache(self, current_windows: list):
-        """Update screenshot cache
+    def _prune_cache(self, existing_xids: frozenset):
+        """Drop cached screenshots for closed windows
+        
+        Args:
+            existing_xids: XIDs of the windows that currently exist
+        """
+        # Clean up old entries
+        for xid in set(self.screenshot_cache.keys()) - existing_xids:
+            try:
+                del self.screenshot_cache[xid]
+                if xid in self.last_valid_screenshots:
+                    del self.last_valid_screenshots[xid]
+            except (KeyError, AttributeError):
+                pass
+        for xid in set(self._fingerprints.keys()) - existing_xids:
+            del self._fingerprints[xid]
+    
+    def _store_screenshot(self, xid: int, screenshot: GdkPixbuf.Pixbuf):
+        """Cache a screenshot as most recent, evicting the oldest over the limit
+        
+        Args:
+            xid: Window XID
+            screenshot: Scaled pixbuf
+        """
+        self.screenshot_cache[xid] = screenshot
+        self.screenshot_cache.move_to_end(xid)
+        
+        # Enforce cache size limit
+        while len(self.screenshot_cache) > MAX_CACHE_SIZE:
+            key, _ = self.screenshot_cache.popitem(last=False)
+            self.last_valid_screenshots.pop(key, None)
+    
+    def iter_update_cache(self, current_windows: list) -> Iterator[None]:
+        """Update screenshot cache one window at a time
+        
+        Yields after pruning and after each window so the caller can
+        spread the captures over several main loop iterations.
         
         Args:
             current_windows: List of window info dicts
         """
         try:
             # Get existing XIDs
-            existing_xids = {w['xid'] for w in current_windows if w.get('xid')}
-            cached_xids = set(self.screenshot_cache.keys())
-            
-            # Clean up old entries
-            for xid in cached_xids - existing_xids:
-                try:
-                    del self.screenshot_cache[xid]
-                    if xid in self.last_valid_screenshots:
-                        del self.last_valid_screenshots[xid]
-                except (KeyError, AttributeError):
-                    pass
+            existing_xids = frozenset(w['xid'] for w in current_windows if w.get('xid'))
             
-            # Enforce cache size limit
-            if len(self.screenshot_cache) > MAX_CACHE_SIZE:
-                excess = len(self.screenshot_cache) - MAX_CACHE_SIZE
-                keys_to_remove = list(self.screenshot_cache.keys())[:excess]
-                for key in keys_to_remove:
-                    try:
-                        del self.screenshot_cache[key]
-                        if key in self.last_valid_screenshots:
-                            del self.last_valid_screenshots[key]
-                    except (KeyError, AttributeError):
-                        pass
-            
-            # Update screenshots
-            for window_info in current_windows:
-                try:
-                    xid = window_info.get('xid')
-                    if not xid:
-                        continue
-                    
-                    window = self.window_manager.get_window_by_xid(xid)
-                    if not window:
-                        continue
-                    
-                    if not self.window_manager.window_is_valid(window):
-                        continue
-                    
-                    screenshot = self.get_screenshot(window)
-                    if screenshot:
-                        self.screenshot_cache[xid] = screenshot
-                
-                except Exception as e:
-                    logger.debug(f"Error updating screenshot: {e}")
+            # Same windows as last time - nothing to prune, only refresh contents
+            fingerprint = hash(existing_xids)
+            if fingerprint != self._last_window_fingerprint:
+                self._last_window_fingerprint = fingerprint
+                self._prune_cache(existing_xids)
         
         except Exception as e:
             logger.error(f"Error updating cache: {e}")
+            return
+        
+        yield
+        
+        # Update screenshots
+        for window_info in current_windows:
+            try:
+                xid = window_info.get('xid')
+                if not xid:
+                    continue
+                
+                window = self.window_manager.get_window_by_xid(xid)
+                if not window:
+                    continue
+                
+                # get_screenshot() checks window_is_valid() itself
+                screenshot = self.get_screenshot(window)
+                if screenshot:
+                    self._store_screenshot(xid, screenshot)
+            
+            except Exception as e:
+                logger.debug(f"Error updating screenshot: {e}")
+            
+            yield
     
     def create_startup_splash(self):
         """Create startup splash screen"""
@@ -229,10 +328,8 @@ class ScreenshotManager:
         
         # Try to load app icon
         try:
-            import os
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images', 'app_icon.png')
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(icon_path, 64, 64, True)
+            if ICON_EXISTS:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(ICON_PATH, 64, 64, True)
                 icon = Gtk.Image.new_from_pixbuf(pixbuf)
                 vbox.pack_start(icon, False, False, 0)
         except Exception as e:
@@ -280,15 +377,17 @@ class ScreenshotManager:
                 progress.set_fraction(fraction)
                 progress.set_text(f"{current}/{total}")
                 status.set_text(f"Processing window {current} of {total}...")
-            
-            while Gtk.events_pending():
-                Gtk.main_iteration()
         
         except Exception as e:
             logger.debug(f"Error updating progress: {e}")
     
-    def preprocess_startup_thumbnails(self):
-        """Preprocess thumbnails on startup"""
+    def iter_startup_thumbnails(self) -> Iterator[None]:
+        """Preprocess thumbnails on startup one window at a time
+        
+        Yields after showing the splash and after each window, so the
+        caller can run the steps from the main loop and let the splash
+        repaint in between instead of pumping events itself.
+        """
         self.startup_preprocessing_active = True
         logger.info("Starting startup preprocessing...")
         
@@ -296,8 +395,7 @@ class ScreenshotManager:
             self.create_startup_splash()
             
             # Let splash render
-            for _ in range(10):
-                GLib.usleep(10000)
+            yield
             
             # Force update to get current windows (bypass grace period)
             current_windows = self.window_manager.get_user_windows(force_update=True)
@@ -319,14 +417,14 @@ class ScreenshotManager:
                     if not window:
                         continue
                     
-                    screenshot = self.get_screenshot(window)
+                    screenshot = self.get_screenshot(window, fast=True)
                     if screenshot:
-                        self.screenshot_cache[xid] = screenshot
-                    
-                    GLib.usleep(50000)
+                        self._store_screenshot(xid, screenshot)
                 
                 except Exception as e:
                     logger.debug(f"Error preprocessing window {i + 1}: {e}")
+                
+                yield
             
             logger.info("Startup preprocessing complete")
         
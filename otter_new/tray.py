@@ -1,6 +1,5 @@
 """System tray icon for Otter"""
 
-import os
 import logging
 from typing import Callable, Optional
 import gi
@@ -8,6 +7,8 @@ import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GdkPixbuf
 
+from .constants import ICON_PATH, ICON_EXISTS
+
 logger = logging.getLogger(__name__)
 
 # Version info
@@ -36,6 +37,17 @@ class OtterTrayIcon:
         self.on_quit = on_quit
         self.paused = False
         
+        # Decode the icon once; state changes just swap pixbufs
+        self._icon_color = None
+        self._icon_gray = None
+        self._logo_64 = None  # About dialog logo, loaded on first open
+        try:
+            if ICON_EXISTS:
+                self._icon_color = GdkPixbuf.Pixbuf.new_from_file_at_scale(ICON_PATH, 22, 22, True)
+                self._icon_gray = self._make_grayscale(self._icon_color)
+        except Exception as e:
+            logger.error(f"Error loading tray icon: {e}")
+        
         # Create status icon
         self.status_icon = Gtk.StatusIcon()
         self.status_icon.set_title("Otter Window Switcher")
@@ -59,36 +71,14 @@ class OtterTrayIcon:
         Args:
             paused: If True, load grayscale version to indicate paused state
         """
-        try:
-            # Try to load from images directory
-            icon_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'images',
-                'app_icon.png'
-            )
-            
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    icon_path, 22, 22, True
-                )
-                
-                # Convert to grayscale if paused
-                if paused:
-                    pixbuf = self._make_grayscale(pixbuf)
-                
-                self.status_icon.set_from_pixbuf(pixbuf)
-                logger.debug(f"Loaded tray icon from {icon_path} (paused: {paused})")
-            else:
-                # Fallback to stock icon
-                icon_name = "media-playback-pause" if paused else "preferences-system-windows"
-                self.status_icon.set_from_icon_name(icon_name)
-                logger.debug(f"Using fallback stock icon: {icon_name}")
-        
-        except Exception as e:
-            logger.error(f"Error loading tray icon: {e}")
+        if self._icon_color is not None:
+            self.status_icon.set_from_pixbuf(self._icon_gray if paused else self._icon_color)
+            logger.debug("Set tray icon (paused: %s)", paused)
+        else:
             # Fallback to stock icon
             icon_name = "media-playback-pause" if paused else "preferences-system-windows"
             self.status_icon.set_from_icon_name(icon_name)
+            logger.debug("Using fallback stock icon: %s", icon_name)
     
     def _make_grayscale(self, pixbuf: GdkPixbuf.Pixbuf) -> GdkPixbuf.Pixbuf:
         """Convert pixbuf to grayscale
@@ -184,14 +174,13 @@ class OtterTrayIcon:
             self._load_icon(paused=True)
             
             # Stop edge detector
-            if hasattr(self.app, 'edge_detector'):
+            if self.app.edge_detector is not None:
                 self.app.edge_detector.stop()
             
             # Hide window if visible
-            if hasattr(self.app, 'otter_state'):
-                from .main import OtterState
-                if self.app.otter_state == OtterState.VISIBLE:
-                    self.app.hide_window()
+            from .main import OtterState
+            if self.app.otter_state == OtterState.VISIBLE:
+                self.app.hide_window()
         else:
             logger.info("Otter resumed - edge detection enabled")
             self.status_icon.set_tooltip_text("Otter Window Switcher")
@@ -199,8 +188,9 @@ class OtterTrayIcon:
             # Update icon to color
             self._load_icon(paused=False)
             
-            # Restart edge detector
-            if hasattr(self.app, 'edge_detector'):
+            # Restart edge detector (a pending DISABLED timeout restarts it otherwise)
+            from .main import OtterState
+            if self.app.edge_detector is not None and self.app.otter_state != OtterState.DISABLED:
                 self.app.edge_detector.start()
     
     def _on_about(self, menu_item):
@@ -223,16 +213,10 @@ class OtterTrayIcon:
         
         # Load icon for about dialog
         try:
-            icon_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'images',
-                'app_icon.png'
-            )
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    icon_path, 64, 64, True
-                )
-                about.set_logo(pixbuf)
+            if self._logo_64 is None and ICON_EXISTS:
+                self._logo_64 = GdkPixbuf.Pixbuf.new_from_file_at_scale(ICON_PATH, 64, 64, True)
+            if self._logo_64 is not None:
+                about.set_logo(self._logo_64)
         except Exception as e:
             logger.debug(f"Could not load icon for about dialog: {e}")
         
@@ -277,7 +261,7 @@ class OtterTrayIcon:
             else:
                 self.status_icon.set_tooltip_text("Otter Window Switcher")
             
-            logger.debug(f"Tray icon updated for state: {state}, paused: {self.paused}")
+            logger.debug("Tray icon updated for state: %s, paused: %s", state, self.paused)
         
         except Exception as e:
             logger.debug(f"Error updating tray icon for state: {e}")
@@ -1,15 +1,17 @@
 """UI components: window, thumbnails, context menu, splash, styles"""
 
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional
 import gi
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
 gi.require_version("Wnck", "3.0")
-from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Wnck
+gi.require_version("Pango", "1.0")
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Pango, Wnck
 
-from .constants import WORKSPACE_COLORS
+from .constants import WORKSPACE_COLORS, ICON_PATH, ICON_EXISTS, MAX_CACHE_SIZE
 from .geometry import get_pointer_position, get_monitor_at_point, get_monitor_geometry, position_window_at_edge, calculate_layout_dimensions, adjust_position_for_cursor
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,10 @@ def get_css_styles() -> str:
         CSS string
     """
     return """
+    * {
+        transition: none;
+    }
+    
     window {
         background-color: @theme_bg_color;
         border: 1px solid @borders;
@@ -69,6 +75,58 @@ def get_css_styles() -> str:
     """
 
 
+# Application CSS provider, parsed once, and the screens it is registered on
+_app_css_provider: Optional[Gtk.CssProvider] = None
+_app_css_screens: set = set()
+
+# Badge CSS providers keyed by color, parsed once and shared by every badge
+_badge_css_providers: Dict[str, Gtk.CssProvider] = {}
+
+
+def _get_badge_css_provider(color: str) -> Gtk.CssProvider:
+    """Get the shared CSS provider for a workspace badge color
+    
+    Args:
+        color: Badge background color
+        
+    Returns:
+        CSS provider for the color
+    """
+    provider = _badge_css_providers.get(color)
+    if provider is None:
+        css = f"""
+        .workspace-badge {{
+            background-color: {color};
+            color: white;
+        }}
+        """
+        provider = Gtk.CssProvider()
+        provider.load_from_data(css.encode())
+        _badge_css_providers[color] = provider
+    return provider
+
+
+# Generic icon for windows without a screenshot or icon, loaded on first use
+_fallback_icon: Optional[GdkPixbuf.Pixbuf] = None
+
+
+def _get_fallback_icon() -> Optional[GdkPixbuf.Pixbuf]:
+    """Get the generic application icon at dialog size
+    
+    Returns:
+        Icon pixbuf or None if the icon theme has no such icon
+    """
+    global _fallback_icon
+    if _fallback_icon is None:
+        try:
+            _fallback_icon = Gtk.IconTheme.get_default().load_icon(
+                "application-x-executable", 48, 0
+            )
+        except Exception as e:
+            logger.debug(f"Could not load fallback icon: {e}")
+    return _fallback_icon
+
+
 class SwitcherWindow:
     """Main switcher window"""
     
@@ -90,6 +148,11 @@ class SwitcherWindow:
         self.scroll_window = None
         self.grid = None
         self.window_buttons = []
+        # Downscaled icons keyed by (xid, width, height) -> (source, scaled)
+        self._scaled_icons: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        # Workspace border provider currently attached to the window
+        self._tint_provider = None
+        self._tint_css = None
         
         self._create_window()
         self._apply_styles()
@@ -124,6 +187,7 @@ class SwitcherWindow:
         self.scroll_window.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         self.scroll_window.set_min_content_height(200)
         self.scroll_window.set_max_content_height(800)
+        self.scroll_window.set_kinetic_scrolling(False)
         
         # Grid for thumbnails
         self.grid = Gtk.Grid()
@@ -160,10 +224,8 @@ class SwitcherWindow:
         
         # Application icon
         try:
-            import os
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images', 'app_icon.png')
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(icon_path, 32, 32, True)
+            if ICON_EXISTS:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(ICON_PATH, 32, 32, True)
                 icon_image = Gtk.Image.new_from_pixbuf(pixbuf)
                 icon_image.set_halign(Gtk.Align.START)
                 title_bar.pack_start(icon_image, False, False, 0)
@@ -198,17 +260,28 @@ class SwitcherWindow:
     
     def _apply_styles(self):
         """Apply CSS styles"""
+        global _app_css_provider
         try:
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(get_css_styles().encode())
+            if _app_css_provider is None:
+                _app_css_provider = Gtk.CssProvider()
+                _app_css_provider.load_from_data(get_css_styles().encode())
             
+            # Register once per screen so recreating the window doesn't
+            # stack duplicate providers
             screen = Gdk.Screen.get_default()
-            style_context = Gtk.StyleContext()
-            style_context.add_provider_for_screen(
-                screen,
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+            if screen not in _app_css_screens:
+                Gtk.StyleContext.add_provider_for_screen(
+                    screen,
+                    _app_css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                )
+                _app_css_screens.add(screen)
+            
+            # The switcher is a transient popup, so skip fades and other
+            # animated state changes (GTK settings are per screen)
+            settings = Gtk.Settings.get_default()
+            if settings:
+                settings.set_property("gtk-enable-animations", False)
         except Exception as e:
             logger.error(f"Error applying styles: {e}")
     
@@ -239,15 +312,23 @@ class SwitcherWindow:
             }}
             """
             
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(css.encode())
-            
-            self.window.get_style_context().add_provider(
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
-            )
+            # Only reparse when the border changes, and replace the previous
+            # provider instead of adding another one on every show
+            if css != self._tint_css:
+                css_provider = Gtk.CssProvider()
+                css_provider.load_from_data(css.encode())
+                
+                style_context = self.window.get_style_context()
+                if self._tint_provider is not None:
+                    style_context.remove_provider(self._tint_provider)
+                style_context.add_provider(
+                    css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
+                )
+                self._tint_provider = css_provider
+                self._tint_css = css
             
-            logger.debug(f"Applied workspace border: {workspace_color} at {tint_percent}% opacity (WS {workspace_index})")
+            logger.debug("Applied workspace border: %s at %s%% opacity (WS %s)", workspace_color, tint_percent, workspace_index)
         
         except Exception as e:
             logger.debug(f"Error applying workspace border: {e}")
@@ -295,18 +376,24 @@ class SwitcherWindow:
     def populate(self, windows: List[Dict]):
         """Populate window with thumbnails
         
+        Thumbnail slots are reused by index: existing buttons are updated in
+        place and surplus ones hidden, so only missing slots are built.
+        
         Args:
             windows: List of window info dictionaries
         """
-        # Clear existing buttons
-        for button in self.window_buttons:
-            button.destroy()
-        self.window_buttons.clear()
-        
         if not windows:
+            for slot in self.window_buttons:
+                slot['button'].hide()
             logger.debug("No windows to display")
             return
         
+        # Drop scaled icons of windows that no longer exist
+        if self._scaled_icons:
+            xids = {window_info.get('xid') for window_info in windows}
+            for key in [key for key in self._scaled_icons if key[0] not in xids]:
+                del self._scaled_icons[key]
+        
         # Calculate layout
         rows, cols = calculate_layout_dimensions(
             len(windows),
@@ -314,181 +401,281 @@ class SwitcherWindow:
             self.config.get('ncols', 4)
         )
         
-        # Create thumbnails
-        for idx, window_info in enumerate(windows):
-            row = idx // cols
-            col = idx % cols
-            
-            button = self._create_thumbnail_button(window_info)
-            if button:
+        # Create only the slots that don't exist yet
+        while len(self.window_buttons) < len(windows):
+            self.window_buttons.append(self._create_thumbnail_slot())
+        
+        # Update thumbnails
+        screenshots = self.screenshot_manager.screenshot_cache
+        for idx, (slot, window_info) in enumerate(zip(self.window_buttons, windows)):
+            button = slot['button']
+            if not self._update_thumbnail_slot(slot, window_info, screenshots):
+                button.hide()
+                continue
+            
+            row, col = divmod(idx, cols)
+            if slot['position'] is None:
                 self.grid.attach(button, col, row, 1, 1)
-                self.window_buttons.append(button)
+            elif slot['position'] != (col, row):
+                self.grid.child_set_property(button, 'left-attach', col)
+                self.grid.child_set_property(button, 'top-attach', row)
+            slot['position'] = (col, row)
+            button.show()
         
-        # Show all new widgets
-        self.grid.show_all()
+        # Hide slots left over from a longer window list
+        for slot in self.window_buttons[len(windows):]:
+            slot['button'].hide()
         
         # Force window to resize to fit new content
         self._force_window_resize()
     
-    def _create_thumbnail_button(self, window_info: Dict) -> Optional[Gtk.Widget]:
-        """Create thumbnail button for window
+    def _create_thumbnail_slot(self) -> Dict:
+        """Create an empty thumbnail button slot
+        
+        Returns:
+            Slot dictionary holding the button and the widgets updated on
+            every populate()
+        """
+        # Create button
+        button = Gtk.Button()
+        style_context = button.get_style_context()
+        style_context.add_class("window-button")
+        button.set_relief(Gtk.ReliefStyle.NONE)
+        
+        # Create content box
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        
+        # Thumbnail with overlay for workspace badge
+        image = Gtk.Image()
+        overlay = Gtk.Overlay()
+        overlay.add(image)
+        
+        badge = self._create_workspace_badge()
+        overlay.add_overlay(badge)
+        overlay.set_overlay_pass_through(badge, True)
+        vbox.pack_start(overlay, False, False, 0)
+        
+        # Window name label
+        label = Gtk.Label()
+        label.set_max_width_chars(20)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        vbox.pack_start(label, False, False, 0)
+        
+        button.add(vbox)
+        vbox.show_all()
+        
+        # Visibility of the slot and its badge is managed by populate(), so
+        # keep a later show_all() on the window from revealing them
+        badge.set_no_show_all(True)
+        button.set_no_show_all(True)
+        
+        slot = {
+            'button': button,
+            'style_context': style_context,
+            'minimized': False,
+            'image': image,
+            'label': label,
+            'badge': badge,
+            'badge_provider': None,
+            'xid': None,
+            'position': None,
+        }
+        
+        # Connect events once; handlers read the slot's current XID
+        button.connect("clicked", self._on_slot_clicked, slot)
+        button.connect("button-press-event", self._on_slot_button_press, slot)
+        
+        return slot
+    
+    def _update_thumbnail_slot(self, slot: Dict, window_info: Dict, screenshots: Dict) -> bool:
+        """Update a thumbnail slot to show a window
         
         Args:
+            slot: Slot dictionary from _create_thumbnail_slot()
             window_info: Window information dictionary
+            screenshots: Screenshot cache mapping XID to thumbnail pixbuf
             
         Returns:
-            Button widget or None
+            True if the slot shows the window
         """
         try:
-            xid = window_info.get('xid')
+            get = window_info.get
+            xid = get('xid')
             if not xid:
-                return None
+                return False
             
-            name = window_info.get('name', 'Unknown')
-            is_minimized = window_info.get('is_minimized', False)
-            workspace_index = window_info.get('workspace_index')
-            
-            # Create button
-            button = Gtk.Button()
-            button.get_style_context().add_class("window-button")
-            if is_minimized:
-                button.get_style_context().add_class("minimized-window-button")
-            button.set_relief(Gtk.ReliefStyle.NONE)
-            
-            # Create content box
-            vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-            
-            # Get thumbnail
-            thumbnail = self._create_thumbnail(window_info)
-            if thumbnail:
-                # Overlay for workspace badge
-                overlay = Gtk.Overlay()
-                overlay.add(thumbnail)
-                
-                # Add workspace badge if available
-                if workspace_index:
-                    badge = self._create_workspace_badge(workspace_index)
-                    if badge:
-                        overlay.add_overlay(badge)
-                        overlay.set_overlay_pass_through(badge, True)
-                
-                vbox.pack_start(overlay, False, False, 0)
+            name = get('name', 'Unknown')
+            is_minimized = get('is_minimized', False)
+            button = slot['button']
+            slot['xid'] = xid
             
-            # Window name label
-            label = Gtk.Label()
-            label.set_text(name)
-            label.set_max_width_chars(20)
-            label.set_ellipsize(3)  # ELLIPSIZE_END
-            vbox.pack_start(label, False, False, 0)
+            if is_minimized != slot['minimized']:
+                if is_minimized:
+                    slot['style_context'].add_class("minimized-window-button")
+                else:
+                    slot['style_context'].remove_class("minimized-window-button")
+                slot['minimized'] = is_minimized
             
-            button.add(vbox)
+            self._set_thumbnail(slot['image'], xid, screenshots.get(xid))
+            self._set_workspace_badge(slot, get('workspace_index'))
+            slot['label'].set_text(name)
             
             # Set tooltip to application name (if enabled)
             if self.config.get('show_tooltips', False):
-                app_name = window_info.get('app_name', name)
-                button.set_tooltip_text(app_name)
+                button.set_tooltip_text(get('app_name', name))
             
-            # Connect events
-            button.connect("clicked", self.event_handler.on_window_clicked, xid)
-            button.connect("button-press-event", self.event_handler.on_button_press, xid)
-            
-            return button
+            return True
         
         except Exception as e:
-            logger.error(f"Error creating thumbnail button: {e}")
-            return None
+            logger.error(f"Error updating thumbnail button: {e}")
+            return False
     
-    def _create_thumbnail(self, window_info: Dict) -> Optional[Gtk.Widget]:
-        """Create thumbnail image
+    def _on_slot_clicked(self, button, slot: Dict):
+        """Forward a thumbnail click for the slot's current window
         
         Args:
-            window_info: Window information dictionary
+            button: GTK button
+            slot: Slot dictionary
+        """
+        self.event_handler.on_window_clicked(button, slot['xid'])
+    
+    def _on_slot_button_press(self, button, event, slot: Dict) -> bool:
+        """Forward a thumbnail button press for the slot's current window
+        
+        Args:
+            button: GTK button
+            event: Button event
+            slot: Slot dictionary
             
         Returns:
-            Image widget or None
+            True if handled
+        """
+        return self.event_handler.on_button_press(button, event, slot['xid'])
+    
+    def _set_thumbnail(self, image: Gtk.Image, xid: int, screenshot: Optional[GdkPixbuf.Pixbuf]):
+        """Set thumbnail image for a window
+        
+        Args:
+            image: Image widget to update
+            xid: Window XID
+            screenshot: Cached screenshot for the window, if any
         """
         try:
-            xid = window_info.get('xid')
-            if not xid:
-                return None
-            
-            # Try to get screenshot from cache
-            screenshot = self.screenshot_manager.screenshot_cache.get(xid)
-            
-            if screenshot:
-                image = Gtk.Image.new_from_pixbuf(screenshot)
-                return image
+            pixbuf = screenshot
             
-            # Fallback to icon
-            icon = window_info.get('icon')
+            # Fallback to icon, fetched only for windows without a screenshot
+            icon = None if pixbuf else self.window_manager.get_window_icon(xid)
             if icon:
-                # Scale icon to thumbnail size
+                # Scale icon to thumbnail size (icons are never upscaled, so
+                # one that already fits is used as-is without a copy)
                 width = self.config.get('xsize', 160)
                 height = int(width * 0.75)
+                icon_width = icon.get_width()
+                icon_height = icon.get_height()
                 
-                scaled_icon = icon.scale_simple(
-                    min(width, icon.get_width()),
-                    min(height, icon.get_height()),
-                    GdkPixbuf.InterpType.BILINEAR
-                )
+                if icon_width > width or icon_height > height:
+                    icon = self._get_scaled_icon(xid, icon, width, height)
                 
-                image = Gtk.Image.new_from_pixbuf(scaled_icon)
-                return image
+                pixbuf = icon
+            
+            # Generic icon, decoded once and shared by all thumbnails
+            if not pixbuf:
+                pixbuf = _get_fallback_icon()
             
-            # Final fallback: generic icon
-            image = Gtk.Image.new_from_icon_name(
+            if pixbuf:
+                # A recycled slot often shows the same pixbuf as last time;
+                # setting it again would still invalidate the image's size
+                if image.get_pixbuf() is not pixbuf:
+                    image.set_from_pixbuf(pixbuf)
+                return
+            
+            # Final fallback: let the image look up the icon itself
+            image.set_from_icon_name(
                 "application-x-executable",
                 Gtk.IconSize.DIALOG
             )
-            return image
         
         except Exception as e:
-            logger.debug(f"Error creating thumbnail: {e}")
-            return None
+            logger.debug(f"Error setting thumbnail: {e}")
     
-    def _create_workspace_badge(self, workspace_index: int) -> Optional[Gtk.Widget]:
-        """Create workspace badge
+    def _get_scaled_icon(self, xid: int, icon: GdkPixbuf.Pixbuf, width: int, height: int) -> GdkPixbuf.Pixbuf:
+        """Get icon downscaled to fit the thumbnail, reusing earlier results
         
         Args:
-            workspace_index: Workspace number (1-indexed)
+            xid: Window XID
+            icon: Source icon pixbuf
+            width: Thumbnail width
+            height: Thumbnail height
             
         Returns:
-            Badge widget or None
+            Scaled icon pixbuf
+        """
+        key = (xid, width, height)
+        cached = self._scaled_icons.get(key)
+        if cached is not None and cached[0] is icon:
+            self._scaled_icons.move_to_end(key)
+            return cached[1]
+        
+        scaled = icon.scale_simple(
+            min(width, icon.get_width()),
+            min(height, icon.get_height()),
+            GdkPixbuf.InterpType.BILINEAR
+        )
+        self._scaled_icons[key] = (icon, scaled)
+        self._scaled_icons.move_to_end(key)
+        while len(self._scaled_icons) > MAX_CACHE_SIZE:
+            self._scaled_icons.popitem(last=False)
+        return scaled
+    
+    def _create_workspace_badge(self) -> Gtk.Widget:
+        """Create workspace badge
+        
+        Returns:
+            Badge widget (text and color are set by _set_workspace_badge)
+        """
+        label = Gtk.Label()
+        label.get_style_context().add_class("workspace-badge")
+        label.set_halign(Gtk.Align.END)
+        label.set_valign(Gtk.Align.START)
+        label.set_margin_top(5)
+        label.set_margin_end(5)
+        return label
+    
+    def _set_workspace_badge(self, slot: Dict, workspace_index: Optional[int]):
+        """Update a slot's workspace badge
+        
+        Args:
+            slot: Slot dictionary
+            workspace_index: Workspace number (1-indexed), or None to hide the badge
         """
+        badge = slot['badge']
+        if not workspace_index:
+            badge.hide()
+            return
+        
         try:
             # Get color for workspace
             color_index = (workspace_index - 1) % len(WORKSPACE_COLORS)
-            color = WORKSPACE_COLORS[color_index]
+            provider = _get_badge_css_provider(WORKSPACE_COLORS[color_index])
             
-            # Create label
-            label = Gtk.Label()
-            label.set_text(str(workspace_index))
-            label.get_style_context().add_class("workspace-badge")
-            label.set_halign(Gtk.Align.END)
-            label.set_valign(Gtk.Align.START)
-            label.set_margin_top(5)
-            label.set_margin_end(5)
+            badge.set_text(str(workspace_index))
             
             # Apply color
-            css = f"""
-            .workspace-badge {{
-                background-color: {color};
-                color: white;
-            }}
-            """
-            
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(css.encode())
-            label.get_style_context().add_provider(
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+            if slot['badge_provider'] is not provider:
+                style_context = badge.get_style_context()
+                if slot['badge_provider'] is not None:
+                    style_context.remove_provider(slot['badge_provider'])
+                style_context.add_provider(
+                    provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                )
+                slot['badge_provider'] = provider
             
-            return label
+            badge.show()
         
         except Exception as e:
-            logger.debug(f"Error creating badge: {e}")
-            return None
+            logger.debug(f"Error updating badge: {e}")
+            badge.hide()
     
     def position_at_edge(self):
         """Position window at configured edge, near cursor"""
@@ -501,19 +688,16 @@ class SwitcherWindow:
 
             monitor_geom = get_monitor_geometry(monitor)
 
-            # Get window size
-            self.window.show_all()
-            width = self.window.get_allocated_width()
-            height = self.window.get_allocated_height()
+            # Get window size - measure the preferred size rather than
+            # mapping the window first to read its allocation
+            min_size, natural_size = self.window.get_preferred_size()
+            width = natural_size.width
+            height = natural_size.height
+            if width <= 0 or height <= 0:
+                width = self.window.get_allocated_width()
+                height = self.window.get_allocated_height()
 
-            # Determine edge
-            edge = 'north'
-            if self.config.get('south'):
-                edge = 'south'
-            elif self.config.get('east'):
-                edge = 'east'
-            elif self.config.get('west'):
-                edge = 'west'
+            edge = self.config.get('edge', 'north')
 
             # Calculate position at edge
             pos_x, pos_y = position_window_at_edge(width, height, edge, monitor_geom)
@@ -574,16 +758,13 @@ class SwitcherWindow:
             self.window.set_size_request(-1, -1)
             self.window.queue_resize()
             
-            # Process pending events to let GTK calculate new size
-            while Gtk.events_pending():
-                Gtk.main_iteration()
-            
-            # Try to get preferred size and resize
+            # Try to get preferred size and resize - get_preferred_size()
+            # measures synchronously, so there's no need to pump the event loop
             try:
                 min_size, natural_size = self.window.get_preferred_size()
                 if natural_size.width > 0 and natural_size.height > 0:
                     self.window.resize(natural_size.width, natural_size.height)
-                    logger.debug(f"Resized window to preferred size: {natural_size.width}x{natural_size.height}")
+                    logger.debug("Resized window to preferred size: %dx%d", natural_size.width, natural_size.height)
                     return
             except Exception as e:
                 logger.debug(f"Preferred size method failed: {e}")
@@ -598,6 +779,8 @@ class SwitcherWindow:
                 rows = 0
                 cols = 0
                 for child in self.grid.get_children():
+                    if not child.get_visible():
+                        continue
                     left = self.grid.child_get_property(child, 'left-attach')
                     top = self.grid.child_get_property(child, 'top-attach')
                     cols = max(cols, left + 1)
@@ -613,7 +796,7 @@ class SwitcherWindow:
                         grid_height += 60  # Approximate title bar height
                     
                     self.window.resize(grid_width, grid_height)
-                    logger.debug(f"Resized window to calculated size: {grid_width}x{grid_height} (grid: {rows}x{cols})")
+                    logger.debug("Resized window to calculated size: %dx%d (grid: %dx%d)", grid_width, grid_height, rows, cols)
                 
             except Exception as e:
                 logger.debug(f"Calculated size method failed: {e}")
@@ -636,6 +819,108 @@ class ContextMenu:
         self.window_manager = window_manager
         self.switcher_window = switcher_window
         self.on_menu_closed = on_menu_closed
+        
+        # The menu is built once; show() only retargets it at a window
+        self._xid = None
+        self._workspaces_key = None
+        self._menu = None
+        self._maximize_item = None
+        self._workspaces_item = None
+        self._build_menu()
+    
+    def _build_menu(self):
+        """Build the static menu items"""
+        menu = Gtk.Menu()
+        
+        # Move to current display
+        item = Gtk.MenuItem(label="Move app to current display")
+        item.connect("activate", self._on_menu_item, self._on_move_to_display)
+        menu.append(item)
+        
+        # Resize to current display
+        item = Gtk.MenuItem(label="Resize app to current display")
+        item.connect("activate", self._on_menu_item, self._on_resize_to_display)
+        menu.append(item)
+        
+        menu.append(Gtk.SeparatorMenuItem())
+        
+        # Minimize
+        item = Gtk.MenuItem(label="Minimize app")
+        item.connect("activate", self._on_menu_item, self._on_minimize)
+        menu.append(item)
+        
+        # Maximize/Restore (label is updated in show())
+        self._maximize_item = Gtk.MenuItem(label="Maximize app")
+        self._maximize_item.connect("activate", self._on_menu_item, self._on_maximize)
+        menu.append(self._maximize_item)
+        
+        menu.append(Gtk.SeparatorMenuItem())
+        
+        # Switch to app (activate window)
+        item = Gtk.MenuItem(label="Switch to app")
+        item.connect("activate", self._on_menu_item, self._on_switch_to_app)
+        menu.append(item)
+        
+        # Go to app's workspace (without activating)
+        item = Gtk.MenuItem(label="Go to app's workspace")
+        item.connect("activate", self._on_menu_item, self._on_go_to_workspace)
+        menu.append(item)
+        
+        # Move to workspace submenu (filled in by _update_workspaces_menu)
+        self._workspaces_item = Gtk.MenuItem(label="Move to Workspace")
+        menu.append(self._workspaces_item)
+        
+        menu.append(Gtk.SeparatorMenuItem())
+        
+        # Drag mode
+        item = Gtk.MenuItem(label="Drag App")
+        item.connect("activate", self._on_menu_item, self._on_drag_app)
+        menu.append(item)
+        
+        # Connect close handler
+        menu.connect("deactivate", lambda m: self.on_menu_closed())
+        
+        menu.show_all()
+        self._menu = menu
+    
+    def _update_workspaces_menu(self):
+        """Rebuild the workspace submenu if the workspaces changed"""
+        try:
+            screen = self.window_manager.screen_wnck
+            workspaces = screen.get_workspaces() if screen else []
+            key = tuple((ws.get_name(), ws.get_number()) for ws in workspaces)
+            if key == self._workspaces_key:
+                return
+            
+            workspaces_menu = Gtk.Menu()
+            for ws_name, ws_num in key:
+                item = Gtk.MenuItem(label=ws_name)
+                item.connect("activate", self._on_workspace_menu_item, ws_num)
+                workspaces_menu.append(item)
+            workspaces_menu.show_all()
+            
+            self._workspaces_item.set_submenu(workspaces_menu)
+            self._workspaces_key = key
+        except Exception as e:
+            logger.debug(f"Error creating workspace menu: {e}")
+    
+    def _on_menu_item(self, menu_item, handler: callable):
+        """Forward a menu item activation for the current window
+        
+        Args:
+            menu_item: Activated menu item
+            handler: Item handler taking (menu_item, xid)
+        """
+        handler(menu_item, self._xid)
+    
+    def _on_workspace_menu_item(self, menu_item, workspace_num: int):
+        """Forward a workspace submenu activation for the current window
+        
+        Args:
+            menu_item: Activated menu item
+            workspace_num: Target workspace number
+        """
+        self._on_move_to_workspace(menu_item, self._xid, workspace_num)
     
     def show(self, xid: int):
         """Show context menu for window
@@ -649,24 +934,7 @@ class ContextMenu:
                 logger.warning(f"Window {xid} not found")
                 return
 
-            menu = Gtk.Menu()
-
-            # Move to current display
-            item = Gtk.MenuItem(label="Move app to current display")
-            item.connect("activate", self._on_move_to_display, xid)
-            menu.append(item)
-
-            # Resize to current display
-            item = Gtk.MenuItem(label="Resize app to current display")
-            item.connect("activate", self._on_resize_to_display, xid)
-            menu.append(item)
-
-            menu.append(Gtk.SeparatorMenuItem())
-
-            # Minimize
-            item = Gtk.MenuItem(label="Minimize app")
-            item.connect("activate", self._on_minimize, xid)
-            menu.append(item)
+            self._xid = xid
 
             # Maximize/Restore (toggle based on current state)
             maximize_label = "Maximize app"
@@ -675,55 +943,11 @@ class ContextMenu:
                     maximize_label = "Restore app"
             except Exception as e:
                 logger.debug(f"Could not check maximized state for menu label: {e}")
-
-            item = Gtk.MenuItem(label=maximize_label)
-            item.connect("activate", self._on_maximize, xid)
-            menu.append(item)
-            
-            menu.append(Gtk.SeparatorMenuItem())
-            
-            # Switch to app (activate window)
-            item = Gtk.MenuItem(label="Switch to app")
-            item.connect("activate", self._on_switch_to_app, xid)
-            menu.append(item)
-            
-            # Go to app's workspace (without activating)
-            item = Gtk.MenuItem(label="Go to app's workspace")
-            item.connect("activate", self._on_go_to_workspace, xid)
-            menu.append(item)
-            
-            # Move to workspace submenu
-            workspaces_item = Gtk.MenuItem(label="Move to Workspace")
-            workspaces_menu = Gtk.Menu()
+            self._maximize_item.set_label(maximize_label)
             
-            try:
-                screen = self.window_manager.screen_wnck
-                if screen:
-                    workspaces = screen.get_workspaces()
-                    for ws in workspaces:
-                        ws_name = ws.get_name()
-                        ws_num = ws.get_number()
-                        item = Gtk.MenuItem(label=ws_name)
-                        item.connect("activate", self._on_move_to_workspace, xid, ws_num)
-                        workspaces_menu.append(item)
-            except Exception as e:
-                logger.debug(f"Error creating workspace menu: {e}")
-            
-            workspaces_item.set_submenu(workspaces_menu)
-            menu.append(workspaces_item)
-            
-            menu.append(Gtk.SeparatorMenuItem())
-            
-            # Drag mode
-            item = Gtk.MenuItem(label="Drag App")
-            item.connect("activate", self._on_drag_app, xid)
-            menu.append(item)
+            self._update_workspaces_menu()
             
-            # Connect close handler
-            menu.connect("deactivate", lambda m: self.on_menu_closed())
-            
-            menu.show_all()
-            menu.popup_at_pointer(None)
+            self._menu.popup_at_pointer(None)
         
         except Exception as e:
             logger.error(f"Error showing context menu: {e}")
@@ -737,7 +961,7 @@ class ContextMenu:
         3. Resizes if maximized to fit the new display
         """
         try:
-            logger.info(f"Move to display requested for window XID {xid}")
+            logger.info("Move to display requested for window XID %s", xid)
             
             window = self.window_manager.get_window_by_xid(xid)
             if not window:
@@ -747,13 +971,13 @@ class ContextMenu:
             # Log window info
             try:
                 window_name = window.get_name()
-                logger.info(f"Moving window: {window_name}")
+                logger.info("Moving window: %s", window_name)
             except Exception:
                 pass
             
             # Get monitor where mouse cursor is (current display)
             x, y = get_pointer_position()
-            logger.debug(f"Mouse position: ({x}, {y})")
+            logger.debug("Mouse position: (%s, %s)", x, y)
             
             monitor = get_monitor_at_point(x, y)
             if not monitor:
@@ -761,7 +985,7 @@ class ContextMenu:
                 return
             
             monitor_geom = get_monitor_geometry(monitor)
-            logger.info(f"Target monitor geometry: {monitor_geom}")
+            logger.info("Target monitor geometry: %s", monitor_geom)
             
             # Move to current workspace
             screen = self.window_manager.screen_wnck
@@ -772,7 +996,7 @@ class ContextMenu:
                         current_workspace = window.get_workspace()
                         if current_workspace != active_workspace:
                             window.move_to_workspace(active_workspace)
-                            logger.debug(f"Moved window to workspace {active_workspace.get_name()}")
+                            logger.debug("Moved window to workspace %s", active_workspace.get_name())
                     except Exception as e:
                         logger.debug(f"Could not move to workspace: {e}")
             
@@ -780,7 +1004,7 @@ class ContextMenu:
             is_maximized = False
             try:
                 is_maximized = window.is_maximized()
-                logger.debug(f"Window maximized: {is_maximized}")
+                logger.debug("Window maximized: %s", is_maximized)
             except Exception as e:
                 logger.debug(f"Could not check maximized state: {e}")
             
@@ -816,7 +1040,7 @@ class ContextMenu:
             False (don't repeat if called from timeout)
         """
         try:
-            logger.debug(f"_finish_move_to_display called (was_maximized={was_maximized})")
+            logger.debug("_finish_move_to_display called (was_maximized=%s)", was_maximized)
             if was_maximized:
                 # Resize to fit new display (80% of monitor size)
                 new_width = int(monitor_geom['width'] * 0.8)
@@ -830,7 +1054,7 @@ class ContextMenu:
                     Wnck.WindowMoveResizeMask.WIDTH | Wnck.WindowMoveResizeMask.HEIGHT,
                     new_x, new_y, new_width, new_height
                 )
-                logger.debug(f"Resized window to fit display: {new_width}x{new_height} at ({new_x}, {new_y})")
+                logger.debug("Resized window to fit display: %sx%s at (%s, %s)", new_width, new_height, new_x, new_y)
             else:
                 # Just move, preserve size
                 try:
@@ -860,7 +1084,7 @@ class ContextMenu:
                     Wnck.WindowMoveResizeMask.WIDTH | Wnck.WindowMoveResizeMask.HEIGHT,
                     new_x, new_y, current_width, current_height
                 )
-                logger.debug(f"Moved window to display: {current_width}x{current_height} at ({new_x}, {new_y})")
+                logger.debug("Moved window to display: %sx%s at (%s, %s)", current_width, current_height, new_x, new_y)
             
             # Activate window to bring it to front
             try:
@@ -869,7 +1093,7 @@ class ContextMenu:
                     logger.debug("Window is no longer valid, skipping activation")
                 else:
                     import time
-                    timestamp = int(time.time() * 1000) & 0xFFFFFFFF
+                    timestamp = int(time.monotonic() * 1000) & 0xFFFFFFFF
                     window.activate(timestamp)
                     logger.debug("Activated window (brought to front)")
             except Exception as e:
@@ -963,10 +1187,10 @@ class ContextMenu:
 
             # Toggle the state
             if is_maximized:
-                logger.debug(f"Window {xid} is maximized, unmaximizing...")
+                logger.debug("Window %s is maximized, unmaximizing...", xid)
                 window.unmaximize()
             else:
-                logger.debug(f"Window {xid} is not maximized, maximizing...")
+                logger.debug("Window %s is not maximized, maximizing...", xid)
                 window.maximize()
 
         except Exception as e:
@@ -979,18 +1203,19 @@ class ContextMenu:
             if not window:
                 return
             
+            # Both activations belong to the same menu event
+            timestamp = Gtk.get_current_event_time()
+            
             # Activate workspace first
             try:
                 workspace = window.get_workspace()
                 if workspace:
-                    timestamp = Gtk.get_current_event_time()
                     workspace.activate(timestamp)
             except Exception as e:
                 logger.debug(f"Could not activate workspace: {e}")
             
             # Then activate window
             try:
-                timestamp = Gtk.get_current_event_time()
                 window.activate(timestamp)
             except Exception as e:
                 logger.error(f"Could not activate window: {e}")
@@ -3,16 +3,56 @@
 import logging
 import time
 import threading
+from functools import lru_cache
 from typing import List, Dict, Optional
 import gi
 
 gi.require_version("Wnck", "3.0")
-from gi.repository import Wnck
+from gi.repository import GdkPixbuf, Wnck
 
-from .constants import SYSTEM_APPS, WNCK_RECREATION_INTERVAL, WNCK_MAX_CALLS, WNCK_GRACE_PERIOD
+from .constants import SYSTEM_APPS, WNCK_RECREATION_INTERVAL, WNCK_MAX_CALLS, WNCK_GRACE_PERIOD, WINDOW_LIST_CACHE_TTL, WNCK_FORCE_UPDATE_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# Lowercased once for the per-window filter in get_user_windows()
+_SYSTEM_APPS_LOWER = frozenset(app.lower() for app in SYSTEM_APPS)
+
+# Resolved once - GI enum attribute access is slow inside the window loop
+_WNCK_NORMAL = Wnck.WindowType.NORMAL
+
+
+@lru_cache(maxsize=512)
+def _app_name_from_title(window_name: str) -> str:
+    """Guess an application name from a window title
+    
+    Titles rarely change between refreshes, so results are memoized.
+    
+    Args:
+        window_name: Full window title
+        
+    Returns:
+        Application name
+    """
+    # Common patterns: "Title - AppName", "Title | AppName", "AppName: Title"
+    # (partition scans once and builds no intermediate list)
+    head, sep, tail = window_name.rpartition(" - ")
+    if sep:
+        # Last part after " - " (e.g., "Page Title - Mozilla Firefox")
+        return tail.strip()
+    
+    head, sep, tail = window_name.rpartition(" | ")
+    if sep:
+        # Last part after " | "
+        return tail.strip()
+    
+    head, sep, tail = window_name.partition(": ")
+    if sep:
+        # First part before ": " (e.g., "Firefox: Page Title")
+        return head.strip()
+    
+    # Last resort: use full window name
+    return window_name
+
 
 class WindowManager:
     """Manages Wnck screen and window operations"""
@@ -26,17 +66,33 @@ class WindowManager:
         """
         self.config = config
         self.on_window_changed = on_window_changed_callback
+        self._ignored_names = frozenset(
+            name.lower() for name in config.get('ignore_list', [])
+        )
         
         # Wnck screen management
         self.screen_wnck = None
-        self.wnck_lock = threading.RLock()
+        self.wnck_lock = threading.Lock()
         self.wnck_recreating = False
         self.wnck_last_recreation = 0
+        self.wnck_recreate_deadline = WNCK_RECREATION_INTERVAL
         self.wnck_call_count = 0
+        self.wnck_last_force_update = 0.0
         
         # MRU tracking
         self.mru_timestamps = {}
         
+        # Last get_user_windows() result, reused by bursts of callers
+        self._window_list_cache = None
+        self._window_list_time = 0.0
+        self._signals_screen = None
+        
+        # Workspace -> (1-based index, name), rebuilt after workspace changes
+        self._workspace_info = None
+        
+        # XID -> Wnck window, kept current by the window open/close signals
+        self._xid_index = {}
+        
         # Initialize Wnck
         self._initialize_wnck()
     
@@ -68,39 +124,74 @@ class WindowManager:
             logger.debug(f"Could not get class instance name: {e}")
         
         # Fallback: extract app name from window title
-        # Common patterns: "Title - AppName", "Title | AppName", "AppName: Title"
-        if " - " in window_name:
-            # Try last part after " - " (e.g., "Page Title - Mozilla Firefox")
-            parts = window_name.split(" - ")
-            return parts[-1].strip()
-        elif " | " in window_name:
-            # Try last part after " | "
-            parts = window_name.split(" | ")
-            return parts[-1].strip()
-        elif ": " in window_name:
-            # Try first part before ": " (e.g., "Firefox: Page Title")
-            parts = window_name.split(": ")
-            return parts[0].strip()
-        
-        # Last resort: use full window name
-        return window_name
+        return _app_name_from_title(window_name)
     
     def _initialize_wnck(self):
         """Initialize Wnck screen"""
         try:
             Wnck.set_client_type(Wnck.ClientType.PAGER)
             self.screen_wnck = Wnck.Screen.get_default()
+            self._connect_screen_signals()
             
-            if self.screen_wnck and self.on_window_changed:
-                self.screen_wnck.connect("window-opened", self.on_window_changed)
-                self.screen_wnck.connect("window-closed", self.on_window_changed)
-            
-            self.wnck_last_recreation = time.time()
+            self.wnck_last_recreation = time.monotonic()
+            self.wnck_recreate_deadline = self.wnck_last_recreation + WNCK_RECREATION_INTERVAL
             logger.info("Wnck screen initialized")
         except Exception as e:
             logger.error(f"Failed to initialize Wnck: {e}")
             self.screen_wnck = None
     
+    def _connect_screen_signals(self):
+        """Connect window and workspace signals, once per Wnck screen
+        
+        Wnck.Screen.get_default() hands back the same screen after a
+        recreation, so connecting unconditionally would stack handlers.
+        """
+        if not self.screen_wnck or self.screen_wnck is self._signals_screen:
+            return
+        
+        self.screen_wnck.connect("window-opened", self._on_screen_window_changed, True)
+        self.screen_wnck.connect("window-closed", self._on_screen_window_changed, False)
+        self.screen_wnck.connect("workspace-created", self._on_workspace_created)
+        self.screen_wnck.connect("workspace-destroyed", self._on_workspaces_changed)
+        for workspace in self.screen_wnck.get_workspaces():
+            workspace.connect("name-changed", self._on_workspaces_changed)
+        self._signals_screen = self.screen_wnck
+    
+    def _on_workspace_created(self, screen, workspace):
+        """Track a new workspace's name and drop the workspace map
+        
+        Args:
+            screen: Wnck screen
+            workspace: Created Wnck workspace
+        """
+        workspace.connect("name-changed", self._on_workspaces_changed)
+        self._on_workspaces_changed()
+    
+    def _on_workspaces_changed(self, *args):
+        """Drop the cached workspace map after a workspace change"""
+        self._workspace_info = None
+    
+    def _on_screen_window_changed(self, screen, window, opened: bool):
+        """Update the XID and MRU maps, drop the cached window list and forward the event
+        
+        Args:
+            screen: Wnck screen
+            window: Opened or closed Wnck window
+            opened: True for window-opened, False for window-closed
+        """
+        self._window_list_cache = None
+        try:
+            if opened:
+                self._xid_index[window.get_xid()] = window
+            else:
+                xid = window.get_xid()
+                self._xid_index.pop(xid, None)
+                self.mru_timestamps.pop(xid, None)
+        except Exception as e:
+            logger.debug(f"Could not update XID index: {e}")
+        if self.on_window_changed:
+            self.on_window_changed(screen, window)
+    
     def window_is_valid(self, window) -> bool:
         """Check if window object is still valid
         
@@ -131,24 +222,58 @@ class WindowManager:
         if not xid or not self.screen_wnck:
             return None
         
+        window = self._xid_index.get(xid)
+        if window is not None:
+            if self.window_is_valid(window):
+                return window
+            del self._xid_index[xid]
+        
+        # Not indexed yet (or stale) - rebuild the index from Wnck's list
         try:
             with self.wnck_lock:
                 if not self.screen_wnck:
                     return None
                 
-                window_list = self.screen_wnck.get_windows()
-                for window in window_list:
-                    if self.window_is_valid(window):
-                        try:
-                            if window.get_xid() == xid:
-                                return window
-                        except Exception:
-                            continue
+                found = None
+                xid_index = {}
+                for window in self.screen_wnck.get_windows():
+                    try:
+                        window_xid = window.get_xid()
+                    except Exception:
+                        continue
+                    xid_index[window_xid] = window
+                    # Only the hit gets the validity probe
+                    if window_xid == xid and self.window_is_valid(window):
+                        found = window
+                self._xid_index = xid_index
+                return found
         except Exception as e:
             logger.debug(f"Error looking up window by XID {xid}: {e}")
         
         return None
     
+    def get_window_icon(self, xid: int) -> Optional[GdkPixbuf.Pixbuf]:
+        """Get the icon Wnck holds for a window
+        
+        Icons are fetched on demand rather than for every window in
+        get_user_windows(), since only windows without a screenshot show them.
+        
+        Args:
+            xid: X11 window ID
+            
+        Returns:
+            Icon pixbuf or None
+        """
+        window = self.get_window_by_xid(xid)
+        if not window:
+            return None
+        
+        try:
+            return window.get_icon()
+        except Exception as e:
+            logger.debug(f"Could not get icon for window {xid}: {e}")
+            return None
+    
     def get_window_id(self, window) -> int:
         """Get unique identifier for window
         
@@ -169,8 +294,8 @@ class WindowManager:
         Returns:
             True if recreation needed
         """
-        # Recreate after time interval
-        if time.time() - self.wnck_last_recreation > WNCK_RECREATION_INTERVAL:
+        # Recreate once the deadline set at the last recreation has passed
+        if time.monotonic() > self.wnck_recreate_deadline:
             logger.info(f"Wnck screen is {WNCK_RECREATION_INTERVAL}s old, recreating...")
             return True
         
@@ -191,19 +316,18 @@ class WindowManager:
             self.wnck_recreating = True
             logger.info(f"Recreating Wnck screen (calls: {self.wnck_call_count})")
             
-            time.sleep(0.2)  # Let old screen settle
-            
+            # No settle delays: nothing is processed while the main loop is
+            # blocked, and the grace period below already defers force_update()
             self.screen_wnck = Wnck.Screen.get_default()
+            self._window_list_cache = None
+            self._workspace_info = None
+            self._xid_index = {}
+            self._connect_screen_signals()
             
-            if self.screen_wnck and self.on_window_changed:
-                self.screen_wnck.connect("window-opened", self.on_window_changed)
-                self.screen_wnck.connect("window-closed", self.on_window_changed)
-            
-            self.wnck_last_recreation = time.time()
+            self.wnck_last_recreation = time.monotonic()
+            self.wnck_recreate_deadline = self.wnck_last_recreation + WNCK_RECREATION_INTERVAL
             self.wnck_call_count = 0
             
-            time.sleep(0.2)  # Let new screen settle
-            
             self.wnck_recreating = False
             logger.info("Wnck screen recreated successfully")
             return True
@@ -227,6 +351,12 @@ class WindowManager:
         if not self.screen_wnck:
             return windows
         
+        # Callers often come in bursts (show, populate, cache refresh);
+        # a list from moments ago is still current
+        if (not force_update and self._window_list_cache is not None
+                and time.monotonic() - self._window_list_time < WINDOW_LIST_CACHE_TTL):
+            return list(self._window_list_cache)
+        
         with self.wnck_lock:
             if self.wnck_recreating:
                 return windows
@@ -237,11 +367,15 @@ class WindowManager:
             self.wnck_call_count += 1
             
             try:
-                # Force update if past grace period OR if explicitly requested
-                time_since_recreation = time.time() - self.wnck_last_recreation
-                if force_update or time_since_recreation >= WNCK_GRACE_PERIOD:
+                # Force update if past grace period OR if explicitly requested;
+                # a sync from moments ago still reflects the server's state
+                now = time.monotonic()
+                time_since_recreation = now - self.wnck_last_recreation
+                recently_updated = now - self.wnck_last_force_update < WNCK_FORCE_UPDATE_INTERVAL
+                if force_update or (time_since_recreation >= WNCK_GRACE_PERIOD and not recently_updated):
                     try:
                         self.screen_wnck.force_update()
+                        self.wnck_last_force_update = time.monotonic()
                     except Exception as e:
                         logger.error(f"force_update() failed: {e}")
                         if self.recreate_wnck_screen():
@@ -257,46 +391,55 @@ class WindowManager:
                 if not window_list:
                     return windows
                 
+                workspace_info = self._workspace_info
+                if workspace_info is None:
+                    workspace_info = {}
+                    try:
+                        for idx, ws in enumerate(self.screen_wnck.get_workspaces()):
+                            workspace_info[ws] = (idx + 1, ws.get_name())
+                        self._workspace_info = workspace_info
+                    except Exception as e:
+                        logger.debug(f"Could not get workspaces: {e}")
+                
+                # Bind loop invariants once instead of per window
+                wnck_normal = _WNCK_NORMAL
+                ignored_names = self._ignored_names
+                get_app_name = self._get_app_name
+                
                 for window in window_list:
                     try:
-                        if not self.window_is_valid(window):
+                        # Get window info - a None name is the same staleness
+                        # signal window_is_valid() probes for
+                        window_name = window.get_name()
+                        if window_name is None:
                             continue
                         
                         # Check window type
                         window_type = window.get_window_type()
-                        if window_type != Wnck.WindowType.NORMAL:
+                        if window_type != wnck_normal:
                             continue
                         
-                        # Get window info
-                        window_name = window.get_name() or "Unknown"
+                        window_name = window_name or "Unknown"
                         
-                        # Try to get clean application name
-                        app_name = self._get_app_name(window, window_name)
-                        
-                        # Check ignore list
-                        is_ignored = any(
-                            window_name.lower() == ignored.lower()
-                            for ignored in self.config.get('ignore_list', [])
-                        )
-                        
-                        # Filter system apps and ignored windows
-                        if (app_name.lower() in [app.lower() for app in SYSTEM_APPS] or
-                            is_ignored or
+                        # Filter ignored windows by title before any more Wnck calls
+                        if (window_name.lower() in ignored_names or
                             window_name == "Otter Window Switcher" or
                             not window_name.strip()):
                             continue
                         
+                        # Try to get clean application name
+                        app_name = get_app_name(window, window_name)
+                        
+                        # Filter system apps
+                        if app_name.lower() in _SYSTEM_APPS_LOWER:
+                            continue
+                        
                         # Get window properties
                         try:
                             is_minimized = window.is_minimized()
                         except Exception:
                             is_minimized = False
                         
-                        try:
-                            icon = window.get_icon()
-                        except Exception:
-                            icon = None
-                        
                         try:
                             xid = window.get_xid()
                         except Exception:
@@ -308,21 +451,19 @@ class WindowManager:
                         try:
                             workspace = window.get_workspace()
                             if workspace:
-                                all_workspaces = self.screen_wnck.get_workspaces()
-                                for idx, ws in enumerate(all_workspaces):
-                                    if ws == workspace:
-                                        workspace_index = idx + 1
-                                        workspace_name = ws.get_name()
-                                        break
+                                workspace_index, workspace_name = workspace_info.get(
+                                    workspace, (None, "Unknown")
+                                )
+                                if workspace_index is None:
+                                    # Unknown workspace - rebuild the map next call
+                                    self._workspace_info = None
                         except Exception:
                             pass
                         
                         # Store window info (never store Wnck object!)
                         windows.append({
-                            'window': None,  # Never store Wnck object
                             'name': window_name,
                             'app_name': app_name,
-                            'icon': icon,
                             'is_minimized': is_minimized,
                             'xid': xid,
                             'workspace_index': workspace_index,
@@ -340,17 +481,15 @@ class WindowManager:
         
         # Apply MRU ordering if enabled
         if self.config.get('recent', False):
-            windows.sort(key=lambda w: w['app_name'].lower())
-            
             try:
-                def get_timestamp(w):
-                    xid = w.get('xid')
-                    return self.mru_timestamps.get(xid, 0) if xid else 0
-                
-                windows.sort(key=get_timestamp, reverse=True)
+                # Most recent first, ties (never-used windows) by app name
+                mru_timestamps = self.mru_timestamps
+                windows.sort(key=lambda w: (-mru_timestamps.get(w['xid'], 0), w['app_name'].lower()))
             except Exception as e:
                 logger.debug(f"Error applying MRU sort: {e}")
         
+        self._window_list_cache = list(windows)
+        self._window_list_time = time.monotonic()
         return windows
     
     def update_mru_timestamp(self, xid: int):
@@ -360,7 +499,8 @@ class WindowManager:
             xid: Window XID
         """
         if xid:
-            self.mru_timestamps[xid] = time.time()
+            self.mru_timestamps[xid] = time.monotonic()
+            self._window_list_cache = None
     
     def is_active_window_fullscreen(self) -> bool:
         """Check if active window is fullscreen